@@ -1,79 +1,127 @@
-import configparser
-import os
-import sys
-from pathlib import Path
-
-
-class AppPaths:
-    """애플리케이션 경로 정보 관리"""
-
-    def __init__(self):
-
-        # 앱의 루트 디렉토리 (개발/배포 환경에 따라 다르게 결정)
-        self.is_packaged = self._check_is_packaged()
-        self.ROOT_DIR = self._get_root_dir()
-
-        # 설정 파일, 아이콘, 스타일시트, 로그 디렉토리 등
-        self.CONFIG_INI_PATH = self.ROOT_DIR / "config" / "settings.ini"
-        self.APP_ICON = self.ROOT_DIR / "resources" / "KDT_logo.png"
-        self.STYLESHEET_PATH = self.ROOT_DIR / "styles" / "stylesheet.qss"
-        self.LOG_DIR = self.ROOT_DIR / "logs"
-
-    def _check_is_packaged(self) -> bool:
-        """
-        앱이 패키징된 실행 파일인지 판단
-        1. DEV_MODE 환경변수가 1이면 강제 개발 모드 (False)
-        2. sys.frozen 속성이 있으면 패키징 모드 (True)
-        """
-        dev_mode = os.getenv("DEV_MODE", "0").strip().lower()
-        if dev_mode in ("1", "true", "yes"):
-            return False
-
-        return getattr(sys, "frozen", False)
-
-    def _get_root_dir(self) -> Path:
-        """실행 환경에 따른 루트 디렉토리 반환"""
-        if self.is_packaged:
-            # 배포 환경: 실행 파일이 있는 폴더
-            return Path(sys.executable).resolve().parent
-        else:
-            # 개발 환경: 프로젝트 루트 (현재 파일의 부모의 부모)
-            return Path(__file__).resolve().parent.parent
-
-
-class AppConfig:
-    """애플리케이션 전체 설정 및 경로 관리"""
-
-    def __init__(self):
-        self.paths = AppPaths()
-        self._config = self._load_settings()
-
-    def _load_settings(self) -> configparser.ConfigParser:
-        """settings.ini 파일을 로드한다."""
-        config = configparser.ConfigParser()
-        if self.paths.CONFIG_INI_PATH.exists():
-            config.read(str(self.paths.CONFIG_INI_PATH), encoding="utf-8")
-        return config
-
-    @property
-    def is_packaged(self) -> bool:
-        """앱이 패키징된 상태인지 여부"""
-        return self.paths.is_packaged
-
-    @property
-    def app_name(self) -> str:
-        """앱 이름을 반환한다."""
-        return self._config.get("App", "APP_NAME", fallback="Quiet Zone Scanner")
-
-    # 필요한 다른 설정값들도 프로퍼티로 추가 가능
-    @property
-    def version(self) -> str:
-        return self._config.get("App", "VERSION", fallback="1.0.0")
-
-    @property
-    def debug(self) -> bool:
-        return self._config.getboolean("App", "DEBUG", fallback=False)
-
-
-# 전역 설정 인스턴스
-APP_CONFIG = AppConfig()
+import configparser
+import mmap
+import os
+import sys
+from pathlib import Path
+
+# 파싱된 settings.ini 캐시
+# 키: (경로, 수정시각(ns), 파일크기) -> 값: 파싱 완료된 ConfigParser
+# 파일이 바뀌면(수정시각/크기 변화) 키가 달라지므로 자동으로 다시 읽게 된다.
+_INI_CACHE: dict[tuple, configparser.ConfigParser] = {}
+
+
+class AppPaths:
+    """애플리케이션 경로 정보 관리"""
+
+    def __init__(self):
+
+        # 앱의 루트 디렉토리 (개발/배포 환경에 따라 다르게 결정)
+        self.is_packaged = self._check_is_packaged()
+
+        # 경로들은 str로 보관한다.
+        # 어차피 Qt/stdlib API 대부분이 str을 받고, 시작 시 한 번씩만 읽히는
+        # 경로에 pathlib 객체 생성 비용(flavor 판정 + 정규화)을 쓸 이유가 없다.
+        # Path가 꼭 필요한 소비자는 받은 쪽에서 Path(...)로 감싼다.
+        root = str(self._get_root_dir())
+        self.ROOT_DIR = root
+
+        # 설정 파일, 아이콘, 스타일시트, 로그 디렉토리 등
+        self.CONFIG_INI_PATH = os.path.join(root, "config", "settings.ini")
+        self.APP_ICON = os.path.join(root, "resources", "KDT_logo.png")
+        self.STYLESHEET_PATH = os.path.join(root, "styles", "stylesheet.qss")
+        self.LOG_DIR = os.path.join(root, "logs")
+
+    def _check_is_packaged(self) -> bool:
+        """
+        앱이 패키징된 실행 파일인지 판단
+        1. DEV_MODE 환경변수가 1이면 강제 개발 모드 (False)
+        2. sys.frozen 속성이 있으면 패키징 모드 (True)
+        """
+        dev_mode = os.getenv("DEV_MODE", "0").strip().lower()
+        if dev_mode in ("1", "true", "yes"):
+            return False
+
+        return getattr(sys, "frozen", False)
+
+    def _get_root_dir(self) -> Path:
+        """실행 환경에 따른 루트 디렉토리 반환"""
+        if self.is_packaged:
+            # 배포 환경: 실행 파일이 있는 폴더
+            return Path(sys.executable).resolve().parent
+        else:
+            # 개발 환경: 프로젝트 루트 (현재 파일의 부모의 부모)
+            return Path(__file__).resolve().parent.parent
+
+
+class AppConfig:
+    """애플리케이션 전체 설정 및 경로 관리"""
+
+    def __init__(self):
+        self.paths = AppPaths()
+        self._config = self._load_settings()
+
+        # 자주 쓰는 설정값은 여기서 한 번만 읽어 평범한 속성으로 저장해둔다.
+        # 프로퍼티 접근 때마다 configparser 내부를 뒤지지 않게 하기 위함이다.
+        self._app_name = self._config.get(
+            "App", "APP_NAME", fallback="Quiet Zone Scanner"
+        )
+        self._version = self._config.get("App", "VERSION", fallback="1.0.0")
+        self._debug = self._config.getboolean("App", "DEBUG", fallback=False)
+
+    def _load_settings(self) -> configparser.ConfigParser:
+        """settings.ini 파일을 로드한다. (같은 파일은 한 번만 파싱하고 캐시에서 재사용)"""
+        try:
+            st = os.stat(self.paths.CONFIG_INI_PATH)
+        except FileNotFoundError:
+            # 파일이 없으면 빈 설정으로 시작 (fallback 값들이 사용됨)
+            return configparser.ConfigParser()
+
+        key = (self.paths.CONFIG_INI_PATH, st.st_mtime_ns, st.st_size)
+        config = _INI_CACHE.get(key)
+        if config is None:
+            config = configparser.ConfigParser()
+            try:
+                # mmap으로 읽으면 open+read+close 파이썬 I/O 계층을 건너뛴다.
+                # 작은 ini 파일의 콜드 스타트 읽기에서 제일 싼 경로다.
+                with open(self.paths.CONFIG_INI_PATH, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        config.read_string(mm[:].decode("utf-8"))
+            except (ValueError, OSError):
+                # 빈 파일(mmap 불가) 등 엣지 케이스는 일반 경로로 폴백
+                config.read(self.paths.CONFIG_INI_PATH, encoding="utf-8")
+            _INI_CACHE[key] = config
+        return config
+
+    @property
+    def is_packaged(self) -> bool:
+        """앱이 패키징된 상태인지 여부"""
+        return self.paths.is_packaged
+
+    @property
+    def app_name(self) -> str:
+        """앱 이름을 반환한다."""
+        return self._app_name
+
+    # 필요한 다른 설정값들도 프로퍼티로 추가 가능
+    @property
+    def version(self) -> str:
+        return self._version
+
+    @property
+    def debug(self) -> bool:
+        return self._debug
+
+
+# 전역 설정 인스턴스 (PEP 562 지연 생성)
+# import 시점이 아니라 APP_CONFIG에 '처음 접근하는 순간' AppConfig()가 만들어진다.
+# 기존의 `from config.app_config import APP_CONFIG` 사용법은 그대로 동작한다.
+_app_config: "AppConfig | None" = None
+
+
+def __getattr__(name: str):
+    global _app_config
+    if name == "APP_CONFIG":
+        if _app_config is None:
+            _app_config = AppConfig()
+        return _app_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
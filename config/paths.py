@@ -1,22 +1,39 @@
-# config/paths.py
-"""
-경로 정보
-    이 앱의 '고정'된 구조 관리
-"""
-from pathlib import Path
-
-# 프로젝트 루트 (현재 파일의 부모의 부모) -> config/paths.py -> config -> root
-ROOT_DIR = Path(__file__).resolve().parent.parent
-
-
-# 사용자 변경 옵션 파일 위치
-CONFIG_INI_PATH = ROOT_DIR / "config" / "settings.ini"
-
-# 앱 아이콘 경로
-APP_ICON = ROOT_DIR / "resources" / "KDT_logo.png"
-
-# 스타일시트
-STYLESHEET_PATH = ROOT_DIR / "styles" / "stylesheet.qss"
-
-# 로그파일 저장 경로
-LOG_DIR = ROOT_DIR / "logs"
+# config/paths.py
+"""
+경로 정보
+    이 앱의 '고정'된 구조 관리
+
+PEP 562 모듈 __getattr__를 사용해 '처음 쓰일 때' 계산된다.
+import만 해서는 Path 객체 생성/resolve() 비용이 들지 않고,
+한 번 계산된 값은 모듈 전역에 캐시되어 이후 접근은 일반 속성 조회다.
+"""
+from pathlib import Path
+
+
+def _build(name: str) -> Path:
+    # 프로젝트 루트 (현재 파일의 부모의 부모) -> config/paths.py -> config -> root
+    root = Path(__file__).resolve().parent.parent
+
+    paths = {
+        "ROOT_DIR": root,
+        # 사용자 변경 옵션 파일 위치
+        "CONFIG_INI_PATH": root / "config" / "settings.ini",
+        # 앱 아이콘 경로
+        "APP_ICON": root / "resources" / "KDT_logo.png",
+        # 스타일시트
+        "STYLESHEET_PATH": root / "styles" / "stylesheet.qss",
+        # 로그파일 저장 경로
+        "LOG_DIR": root / "logs",
+    }
+    return paths[name]
+
+
+def __getattr__(name: str) -> Path:
+    try:
+        value = _build(name)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # 모듈 전역에 심어두면 다음 접근부터는 __getattr__ 자체가 불리지 않는다.
+    globals()[name] = value
+    return value
@@ -1 +1 @@
-# core/__init__.py
+# core/__init__.py
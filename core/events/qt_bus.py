@@ -1,150 +1,234 @@
-# core/events/qt_bus.py
-"""
-[Qt 전용 EventBus 구현체]
-
-PySide6(Qt)의 'Signal/Slot' 메커니즘을 사용하여 구현된 실제 이벤트 버스이다.
-Qt 애플리케이션(GUI가 있는 앱) 환경에서 동작한다.
-
-이 파일은 'EventBus'라는 껍데기와 '_EventBusBackend'라는 알맹이로 나뉜다.
-이렇게 나눈 이유는 'Lazy Initialization(지연 초기화)' 때문이다.
-QObject는 QApplication이 생성되기 전에 만들어지면 안 되는데,
-이 구조를 통해 Import 시점이 아닌, 실제 사용 시점에 QObject를 생성하여 안전성을 확보했다.
-"""
-from __future__ import annotations
-
-from typing import TYPE_CHECKING, Optional
-
-from PySide6.QtCore import QMetaMethod, QObject, Signal
-
-# =============================================================================
-# 1. 시그널 그룹 클래스 정의
-# =============================================================================
-# 각 클래스는 관련된 이벤트들을 묶어서 관리하는 역할을 한다.
-# QObject를 상속받아야 Signal을 정의하고 사용할 수 있다.
-
-
-class SystemSignals(QObject):
-    """시스템 상태(에러, 알림 등)와 관련된 시그널 모음"""
-
-    system_error_occurred = Signal(str)  # 치명적인 에러 발생 시 (메시지)
-    system_notification_received = Signal(str)  # 일반적인 시스템 알림 시 (메시지)
-
-
-class LogSignals(QObject):
-    """로그 출력과 관련된 시그널 모음"""
-
-    # (발생위치, 로그내용, 로그레벨)
-    # 예: emit("MainEngine", "초기화 완료", "INFO")
-    message = Signal(str, str, str)
-
-
-class DataSignals(QObject):
-    """데이터 처리 및 비즈니스 로직 관련 시그널 모음"""
-
-    # (작업이름, 진행중여부) - 예: emit("Scan", True)
-    sequence_activity_changed = Signal(str, bool)
-    # (데이터리스트) - 데이터 로드 완료 시
-    sequence_data_loaded = Signal(list)
-
-
-# =============================================================================
-# 2. 실제 백엔드 (Real QObject)
-# =============================================================================
-class _EventBusBackend(QObject):
-    """
-    실제 시그널 객체들을 보유하고 있는 '진짜' 이벤트 버스이다.
-    이 객체가 생성될 때 하위 시그널 그룹들도 함께 생성된다.
-    """
-
-    def __init__(self):
-        super().__init__()
-        # 위에서 정의한 시그널 그룹들을 인스턴스화하여 멤버로 가짐
-        self.system = SystemSignals()
-        self.log = LogSignals()
-        self.data = DataSignals()
-
-        # 나중에 한꺼번에 연결을 끊거나 관리하기 위해 리스트에 담아둠
-        self._signal_groups = [self.system, self.log, self.data]
-
-    def disconnect_all(self, signal_name: str | None = None) -> None:
-        """
-        연결된 모든 시그널(또는 특정 이름의 시그널)의 연결을 해제한다.
-        리소스 정리나, 화면이 닫힐 때 사용한다.
-        """
-        # ✅ 중요: 이 객체(self)가 아니라, 멤버로 가진 그룹 객체(self.system 등)를 뒤져야 한다.
-        for group in self._signal_groups:
-            meta = group.metaObject()
-            if meta is None:
-                continue
-
-            # 해당 그룹이 가진 모든 메서드를 검사
-            for i in range(meta.methodCount()):
-                m = meta.method(i)
-                # 메서드 타입이 'Signal'인 것만 찾음
-                if m.methodType() != QMetaMethod.MethodType.Signal:
-                    continue
-
-                # 시그널 이름을 가져옴 (예: 'message', 'error')
-                sig_name = m.name().data().decode("utf-8")
-
-                # 사용자가 특정 이름을 요청했으면 그것만, 아니면 전부 다
-                if signal_name is None or sig_name == signal_name:
-                    sig = getattr(group, sig_name, None)
-                    if sig is not None:
-                        try:
-                            # 실제 연결 끊기 시도
-                            sig.disconnect()
-                        except (TypeError, RuntimeError):
-                            # 연결된 게 없는데 끊으려 하면 에러가 날 수 있음. 안전하게 무시.
-                            pass
-
-
-# =============================================================================
-# 3. 껍데기 (Proxy Class)
-# =============================================================================
-class EventBus:
-    """
-    [외부 공개용 클래스]
-
-    이 클래스는 QObject를 상속받지 않았다!
-    그래서 언제 어디서 import 해도 안전하다. (충돌 없음)
-
-    실제 기능은 '_qobject' 속성에 접근하는 순간 생성된 백엔드 객체가 대신 처리한다.
-    """
-
-    def __init__(self):
-        # 내부적으로 진짜 QObject를 담을 변수 (처음엔 비어있음)
-        self._backend: Optional[_EventBusBackend] = None
-
-    @property
-    def _qobject(self) -> _EventBusBackend:
-        """
-        진짜 객체가 필요할 때, 그때서야 생성하는 '게으른(Lazy)' 속성이다.
-        """
-        if self._backend is None:
-            # 이 코드가 실행될 때는 이미 앱(QApplication)이 켜진 후일 것이다.
-            self._backend = _EventBusBackend()
-        return self._backend
-
-    def __getattr__(self, name: str):
-        """
-        사용자가 bus.log.message 처럼 접근하면,
-        자동으로 백엔드 객체(_qobject)에게 그 요청을 토스한다.
-        마치 투명인간처럼 행동한다.
-        """
-        return getattr(self._qobject, name)
-
-    def disconnect_all(self, signal_name: str | None = None):
-        """백엔드에게 연결 해제 명령을 전달한다."""
-        self._qobject.disconnect_all(signal_name)
-
-
-# =============================================================================
-# 전역 인스턴스
-# =============================================================================
-if TYPE_CHECKING:
-    # IDE(VSCode 등)에게는 "이거 사실 _EventBusBackend 야"라고 알려줘서 자동완성을 돕는다.
-    EVENT_BUS = _EventBusBackend()
-else:
-    # 실행 시에는 안전한 껍데기(EventBus)를 내보낸다.
-    EVENT_BUS = EventBus()
+# core/events/qt_bus.py
+"""
+[Qt 전용 EventBus 구현체]
+
+PySide6(Qt)의 'Signal/Slot' 메커니즘을 사용하여 구현된 실제 이벤트 버스이다.
+Qt 애플리케이션(GUI가 있는 앱) 환경에서 동작한다.
+
+이 파일은 'EventBus'라는 껍데기와 '_EventBusBackend'라는 알맹이로 나뉜다.
+이렇게 나눈 이유는 'Lazy Initialization(지연 초기화)' 때문이다.
+QObject는 QApplication이 생성되기 전에 만들어지면 안 되는데,
+이 구조를 통해 Import 시점이 아닌, 실제 사용 시점에 QObject를 생성하여 안전성을 확보했다.
+
+추가로 PySide6 import 자체도 '사용 시점'으로 미뤘다.
+이 모듈을 import하는 것만으로는 QtCore가 메모리에 올라가지 않으므로,
+BaseService 등을 import하는 비용(콜드 스타트 시간 + 메모리)이 크게 줄어든다.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # 타입 검사기용 import (실행 시에는 평가되지 않음)
+    from PySide6.QtCore import QObject
+
+# =============================================================================
+# 1. 시그널 그룹 클래스 정의 (지연 생성)
+# =============================================================================
+# QObject 상속 클래스들은 PySide6가 import된 후에만 정의할 수 있으므로,
+# 클래스 정의 자체를 공장 함수 안으로 옮기고 최초 1회만 만들어 캐시한다.
+
+# {"SystemSignals": <class>, "LogSignals": <class>, "DataSignals": <class>}
+_cls_cache: dict[str, type] = {}
+
+
+def _build_signal_classes() -> dict[str, type]:
+    """
+    시그널 그룹 클래스들을 (최초 호출 시 단 한 번) 정의해서 돌려준다.
+    여기서 처음으로 PySide6가 import된다.
+    """
+    if _cls_cache:
+        return _cls_cache
+
+    from PySide6.QtCore import QObject, Signal
+
+    class SystemSignals(QObject):
+        """시스템 상태(에러, 알림 등)와 관련된 시그널 모음"""
+
+        system_error_occurred = Signal(str)  # 치명적인 에러 발생 시 (메시지)
+        system_notification_received = Signal(str)  # 일반적인 시스템 알림 시 (메시지)
+
+    class LogSignals(QObject):
+        """로그 출력과 관련된 시그널 모음"""
+
+        # (발생위치, 로그내용, 로그레벨)
+        # 예: emit("MainEngine", "초기화 완료", "INFO")
+        # 시그니처는 파이썬 str 3개로 선언한다. (QString 래퍼 없음)
+        # 연결은 반드시 functor 형태(bus.log.message.connect(slot))로 할 것 —
+        # 문자열 SIGNAL()/SLOT() 연결은 strcpy + normalizedSignature 폴백 비용이 든다.
+        message = Signal(str, str, str)
+
+        # 배치 채널: [(발생위치, 로그내용, 로그레벨), ...] 리스트 하나로 N건을
+        # 한 번에 나른다. 큐드 커넥션 기준 QMetaCallEvent 할당과 스레드 홉이
+        # 레코드당 1회에서 배치당 1회로 줄어든다. (지속 부하에서 발신부가 사용)
+        messages = Signal(list)
+
+        def __init__(self):
+            super().__init__()
+            # '직통' 채널: Qt Signal을 거치지 않는 평범한 콜백 리스트.
+            # UI가 로그를 볼 필요 없는 구독자(파일 로거 등)는 여기 등록하면
+            # 문자열 3개의 메타타입 마샬링 + 스레드 홉 비용을 전부 아낀다.
+            self._direct: list = []
+
+        def connect_direct(self, fn) -> None:
+            """직통 채널 구독 (발신 스레드에서 동기로 호출됨에 주의)"""
+            if fn not in self._direct:
+                self._direct.append(fn)
+
+        def disconnect_direct(self, fn=None) -> None:
+            """직통 채널 구독 해제 (None이면 전부 해제)"""
+            if fn is None:
+                self._direct.clear()
+            elif fn in self._direct:
+                self._direct.remove(fn)
+
+        def emit_direct(self, source: str, message: str, level: str) -> None:
+            """Qt를 완전히 우회해서 직통 구독자들만 호출한다."""
+            for fn in self._direct:
+                fn(source, message, level)
+
+    class DataSignals(QObject):
+        """데이터 처리 및 비즈니스 로직 관련 시그널 모음"""
+
+        # (작업이름, 진행중여부) - 예: emit("Scan", True)
+        sequence_activity_changed = Signal(str, bool)
+        # (데이터리스트) - 데이터 로드 완료 시
+        sequence_data_loaded = Signal(list)
+
+    _cls_cache["SystemSignals"] = SystemSignals
+    _cls_cache["LogSignals"] = LogSignals
+    _cls_cache["DataSignals"] = DataSignals
+    return _cls_cache
+
+
+def _signal_names_of(group) -> tuple[str, ...]:
+    """
+    시그널 그룹 '클래스'에 정의된 시그널 이름들을 돌려준다.
+
+    시그널 구성은 클래스마다 고정이므로, 메타오브젝트 순회(파이썬/C++ 경계를
+    넘나드는 비싼 작업)는 클래스당 단 한 번만 하고 결과를 클래스에 캐시한다.
+    """
+    cls = type(group)
+    names = cls.__dict__.get("_signal_names")
+    if names is None:
+        from PySide6.QtCore import QMetaMethod
+
+        collected = []
+        meta = group.metaObject()
+        if meta is not None:
+            for i in range(meta.methodCount()):
+                m = meta.method(i)
+                if m.methodType() == QMetaMethod.MethodType.Signal:
+                    collected.append(m.name().data().decode("utf-8"))
+        names = tuple(collected)
+        cls._signal_names = names
+    return names
+
+
+# =============================================================================
+# 2. 실제 백엔드
+# =============================================================================
+class _EventBusBackend:
+    """
+    실제 시그널 객체들을 보유하고 있는 '진짜' 이벤트 버스이다.
+    이 객체가 생성될 때 하위 시그널 그룹들도 함께 생성된다.
+    (QObject 상속이 필요한 건 시그널 그룹들뿐이라, 백엔드 자신은 순수 파이썬 클래스다)
+    """
+
+    def __init__(self):
+        # 여기서 처음으로 Qt 클래스들이 만들어진다. (QApplication 생성 이후 시점)
+        classes = _build_signal_classes()
+        self.system = classes["SystemSignals"]()
+        self.log = classes["LogSignals"]()
+        self.data = classes["DataSignals"]()
+
+        # 나중에 한꺼번에 연결을 끊거나 관리하기 위해 리스트에 담아둠
+        self._signal_groups = [self.system, self.log, self.data]
+
+        # 시그널 이름표: disconnect_all이 호출될 때마다 리플렉션을 돌리지 않도록
+        # 미리 만들어둔다. 이름 목록 자체는 클래스 단위로 캐시되므로
+        # (_signal_names_of 참고) 두 번째 백엔드부터는 메타오브젝트 순회조차 없다.
+        # 형태: [(시그널이름, 시그널객체), ...]
+        self._sig_table: list[tuple[str, object]] = []
+        for group in self._signal_groups:
+            for sig_name in _signal_names_of(group):
+                sig = getattr(group, sig_name, None)
+                if sig is not None:
+                    self._sig_table.append((sig_name, sig))
+
+    def any_log_subscribers(self) -> bool:
+        """
+        log.message 시그널에 구독자가 하나라도 있는지 확인한다.
+        발신자가 값비싼 emit 인자 준비를 통째로 건너뛸 수 있게 해주는 가드이다.
+        (Qt는 연결 목록을 C++ 쪽에서 관리하므로 메타메서드 조회로 물어본다)
+        """
+        from PySide6.QtCore import QMetaMethod
+
+        return self.log.isSignalConnected(QMetaMethod.fromSignal(self.log.message))
+
+    def disconnect_all(self, signal_name: str | None = None) -> None:
+        """
+        연결된 모든 시그널(또는 특정 이름의 시그널)의 연결을 해제한다.
+        리소스 정리나, 화면이 닫힐 때 사용한다.
+        """
+        # __init__에서 미리 만들어둔 이름표만 돌면 된다. (리플렉션 없음)
+        for sig_name, sig in self._sig_table:
+            # 사용자가 특정 이름을 요청했으면 그것만, 아니면 전부 다
+            if signal_name is None or sig_name == signal_name:
+                try:
+                    # 실제 연결 끊기 시도
+                    sig.disconnect()
+                except (TypeError, RuntimeError):
+                    # 연결된 게 없는데 끊으려 하면 에러가 날 수 있음. 안전하게 무시.
+                    pass
+
+
+# =============================================================================
+# 3. 껍데기 (Proxy Class)
+# =============================================================================
+class EventBus:
+    """
+    [외부 공개용 클래스]
+
+    이 클래스는 QObject를 상속받지 않았다!
+    그래서 언제 어디서 import 해도 안전하다. (충돌 없음)
+
+    실제 기능은 '_qobject' 속성에 접근하는 순간 생성된 백엔드 객체가 대신 처리한다.
+    """
+
+    def __init__(self):
+        # 내부적으로 진짜 백엔드를 담을 변수 (처음엔 비어있음)
+        self._backend: Optional[_EventBusBackend] = None
+
+    @property
+    def _qobject(self) -> _EventBusBackend:
+        """
+        진짜 객체가 필요할 때, 그때서야 생성하는 '게으른(Lazy)' 속성이다.
+        """
+        if self._backend is None:
+            # 이 코드가 실행될 때는 이미 앱(QApplication)이 켜진 후일 것이다.
+            self._backend = _EventBusBackend()
+        return self._backend
+
+    def __getattr__(self, name: str):
+        """
+        사용자가 bus.log.message 처럼 접근하면,
+        자동으로 백엔드 객체(_qobject)에게 그 요청을 토스한다.
+        마치 투명인간처럼 행동한다.
+        """
+        return getattr(self._qobject, name)
+
+    def disconnect_all(self, signal_name: str | None = None):
+        """백엔드에게 연결 해제 명령을 전달한다."""
+        self._qobject.disconnect_all(signal_name)
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+if TYPE_CHECKING:
+    # IDE(VSCode 등)에게는 "이거 사실 _EventBusBackend 야"라고 알려줘서 자동완성을 돕는다.
+    EVENT_BUS = _EventBusBackend()
+else:
+    # 실행 시에는 안전한 껍데기(EventBus)를 내보낸다.
+    EVENT_BUS = EventBus()
@@ -1,115 +1,272 @@
-# core/events/simple_bus.py
-"""
-[Non-Qt 환경용 EventBus 구현체]
-
-Qt 라이브러리(PySide6)가 없는 환경(예: 서버, 단위 테스트, 콘솔 앱)에서도
-비즈니스 로직을 동일하게 돌리기 위해 만든 '가짜(Mock)' 이벤트 버스이다.
-
-Qt의 Signal/Slot과 똑같은 사용법(connect, emit)을 가지지만,
-내부적으로는 단순한 리스트(List)와 루프(Loop)로 동작한다.
-"""
-from __future__ import annotations
-
-from dataclasses import dataclass
-from typing import Any, Callable, List
-
-# Handler: 이벤트를 받을 함수나 메서드의 타입 (어떤 인자든 받고, 뭐든 리턴함)
-Handler = Callable[..., Any]
-
-
-class SimpleSignal:
-    """
-    Qt의 Signal을 흉내 낸 클래스이다.
-    함수들을 리스트에 저장해뒀다가, emit()이 호출되면 순서대로 실행해준다.
-    """
-
-    def __init__(self):
-        self._handlers: List[Handler] = []
-
-    def connect(self, handler: Handler) -> None:
-        """
-        [구독하기]
-        이벤트가 발생하면 실행될 함수(handler)를 등록한다.
-        이미 등록된 함수는 중복해서 등록하지 않는다.
-        """
-        if handler not in self._handlers:
-            self._handlers.append(handler)
-
-    def disconnect(self, handler: Handler | None = None) -> None:
-        """
-        [구독 취소]
-        더 이상 이벤트를 받지 않도록 함수를 목록에서 제거한다.
-        handler가 None이면 모든 구독자를 다 지워버린다.
-        """
-        if handler is None:
-            self._handlers.clear()
-            return
-        if handler in self._handlers:
-            self._handlers.remove(handler)
-
-    def emit(self, *args: Any, **kwargs: Any) -> None:
-        """
-        [방송하기]
-        등록된 모든 함수들에게 신호를 보낸다.
-        인자(*args, **kwargs)는 그대로 전달된다.
-        """
-        # 실행 중에 누가 구독을 취소해서 리스트 크기가 변할 수 있으므로,
-        # 안전하게 복사본(list(...))을 만들어서 순회한다.
-        for h in list(self._handlers):
-            h(*args, **kwargs)
-
-
-# =============================================================================
-# 시그널 그룹 정의 (QtBus와 구조를 맞춤)
-# =============================================================================
-@dataclass
-class _Log:
-    message: SimpleSignal = SimpleSignal()
-
-
-@dataclass
-class _Data:
-    sequence_activity_changed: SimpleSignal = SimpleSignal()
-    sequence_data_loaded: SimpleSignal = SimpleSignal()
-
-
-@dataclass
-class _System:
-    system_error_occurred: SimpleSignal = SimpleSignal()
-    system_notification_received: SimpleSignal = SimpleSignal()
-
-
-# =============================================================================
-# 메인 클래스
-# =============================================================================
-class SimpleEventBus:
-    """
-    Qt가 없을 때 대신 사용하는 이벤트 버스이다.
-    사용법은 QtEventBus와 99% 동일하게 만들어서,
-    코드를 고치지 않고도 환경을 오갈 수 있게 한다.
-    """
-
-    def __init__(self):
-        # 각 그룹별로 SimpleSignal들을 생성하여 배치한다.
-        self.system = _System()
-        self.log = _Log()
-        self.data = _Data()
-
-        # 전체 관리를 위한 리스트
-        self._signal_groups = [self.system, self.log, self.data]
-
-    def disconnect_all(self, signal_name: str | None = None) -> None:
-        """
-        모든 연결을 끊어버린다. (초기화나 종료 시 유용)
-        """
-        # 모든 그룹을 돈다.
-        for group in self._signal_groups:
-            # 그룹 내의 모든 속성(변수)을 확인한다.
-            for attr in dir(group):
-                sig = getattr(group, attr, None)
-
-                # 속성이 SimpleSignal 타입인 경우에만 처리한다.
-                if isinstance(sig, SimpleSignal):
-                    # 특정 이름만 원했으면 이름 체크, 아니면 통과
-                    if signal_name is None or attr == signal_name:
-                        sig.disconnect()  # 싹둑
+# core/events/simple_bus.py
+"""
+[Non-Qt 환경용 EventBus 구현체]
+
+Qt 라이브러리(PySide6)가 없는 환경(예: 서버, 단위 테스트, 콘솔 앱)에서도
+비즈니스 로직을 동일하게 돌리기 위해 만든 '가짜(Mock)' 이벤트 버스이다.
+
+Qt의 Signal/Slot과 똑같은 사용법(connect, emit)을 가지지만,
+내부적으로는 단순한 리스트(List)와 루프(Loop)로 동작한다.
+"""
+from __future__ import annotations
+
+import weakref
+from inspect import ismethod
+from typing import Any, Callable, Dict
+
+# Handler: 이벤트를 받을 함수나 메서드의 타입 (어떤 인자든 받고, 뭐든 리턴함)
+Handler = Callable[..., Any]
+
+
+class SimpleSignal:
+    """
+    Qt의 Signal을 흉내 낸 클래스이다.
+    함수들을 리스트에 저장해뒀다가, emit()이 호출되면 순서대로 실행해준다.
+    """
+
+    # __dict__ 없이 고정 슬롯만 쓴다.
+    # emit 경로의 속성 접근(bus.log.message.emit)이 C 레벨 슬롯 조회로 빨라지고,
+    # 인스턴스당 메모리도 줄어든다. (피클링이 필요 없는 런타임 객체라 부작용 없음)
+    __slots__ = ("_handlers", "_watcher", "_watch_idx", "_dead")
+
+    def __init__(self):
+        # 리스트가 아니라 dict를 쓴다. (값은 의미 없음, None 고정)
+        # - 중복 확인/제거가 O(n) 스캔 대신 O(1) 해시 조회
+        # - 파이썬 3.7+ dict는 삽입 순서를 보존하므로 호출 순서도 그대로
+        self._handlers: Dict[Handler, None] = {}
+
+        # 버스가 구독 상태(0명 <-> 1명 이상 전환)를 추적할 수 있게 해주는 훅.
+        # 버스에 소속되지 않은 단독 시그널은 None으로 남아 비용이 없다.
+        self._watcher: Callable[[int, bool], None] | None = None
+        self._watch_idx = 0
+
+        # emit 중에 발견한 '죽은' 약한 참조 개수 (절반을 넘으면 청소)
+        self._dead = 0
+
+    @staticmethod
+    def _key_of(handler: Handler):
+        """
+        저장용 키를 만든다.
+
+        바운드 메서드는 WeakMethod로 감싼다. 대상 객체가 파괴되면 참조가
+        자동으로 풀려서, 오래 실행되는 세션에서 '죽은 핸들러'가 _handlers에
+        영원히 남아 emit을 느리게 만드는 일을 막는다.
+        (WeakMethod는 같은 바운드 메서드끼리 ==/hash가 일치해서 dict 키로 안전)
+        """
+        if ismethod(handler):
+            return weakref.WeakMethod(handler)
+        return handler
+
+    def connect(self, handler: Handler) -> None:
+        """
+        [구독하기]
+        이벤트가 발생하면 실행될 함수(handler)를 등록한다.
+        이미 등록된 함수는 중복해서 등록하지 않는다.
+        """
+        was_empty = not self._handlers
+        self._handlers.setdefault(self._key_of(handler), None)
+        if was_empty and self._handlers and self._watcher is not None:
+            self._watcher(self._watch_idx, True)
+
+    def disconnect(self, handler: Handler | None = None) -> None:
+        """
+        [구독 취소]
+        더 이상 이벤트를 받지 않도록 함수를 목록에서 제거한다.
+        handler가 None이면 모든 구독자를 다 지워버린다.
+        """
+        had_any = bool(self._handlers)
+        if handler is None:
+            self._handlers.clear()
+            self._dead = 0
+        else:
+            self._handlers.pop(self._key_of(handler), None)
+        if had_any and not self._handlers and self._watcher is not None:
+            self._watcher(self._watch_idx, False)
+
+    def _compact(self) -> None:
+        """죽은 약한 참조들을 한꺼번에 걷어낸다."""
+        had_any = bool(self._handlers)
+        self._handlers = {
+            k: None
+            for k in self._handlers
+            if not (type(k) is weakref.WeakMethod and k() is None)
+        }
+        self._dead = 0
+        if had_any and not self._handlers and self._watcher is not None:
+            self._watcher(self._watch_idx, False)
+
+    @property
+    def has_handlers(self) -> bool:
+        """구독자가 하나라도 있는지 여부 (값비싼 인자 준비를 건너뛸 때 사용)"""
+        return bool(self._handlers)
+
+    def emit(self, *args: Any, **kwargs: Any) -> None:
+        """
+        [방송하기]
+        등록된 모든 함수들에게 신호를 보낸다.
+        인자(*args, **kwargs)는 그대로 전달된다.
+        """
+        handlers = self._handlers
+
+        # 가장 흔한 케이스(구독자 0명/1명)는 복사본 없이 바로 처리한다.
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            h = next(iter(handlers))
+            if type(h) is weakref.WeakMethod:
+                cb = h()
+                if cb is None:
+                    self._compact()
+                    return
+                cb(*args, **kwargs)
+            else:
+                h(*args, **kwargs)
+            return
+
+        # 실행 중에 누가 구독을 취소해서 dict 크기가 변할 수 있으므로,
+        # 안전하게 복사본(tuple)을 만들어서 순회한다.
+        # 약한 참조(WeakMethod)는 여기서 되살려 호출하고, 죽은 것은 세어둔다.
+        dead = 0
+        for h in tuple(handlers):
+            if type(h) is weakref.WeakMethod:
+                cb = h()
+                if cb is None:
+                    dead += 1
+                    continue
+                cb(*args, **kwargs)
+            else:
+                h(*args, **kwargs)
+
+        # 죽은 참조가 절반을 넘으면 압축 (매 emit마다 청소하지 않고 상각)
+        if dead:
+            self._dead += dead
+            if self._dead * 2 >= len(self._handlers):
+                self._compact()
+
+
+# =============================================================================
+# 시그널 그룹 정의 (QtBus와 구조를 맞춤)
+# =============================================================================
+# 일반 클래스로 정의한다. (dataclass 아님)
+# __init__에서 직접 SimpleSignal을 만들기 때문에 인스턴스 간 공유 걱정이 없고,
+# _signals 사전 덕분에 disconnect_all이 dir() 탐색 없이 시그널만 바로 순회할 수 있다.
+class _Log:
+    __slots__ = ("message", "messages", "_signals", "_direct")
+
+    def __init__(self):
+        self.message = SimpleSignal()
+        # 배치 채널: 튜플 리스트 하나로 N건을 한 번에 나른다 (QtBus와 동일 구조)
+        self.messages = SimpleSignal()
+        self._signals = {"message": self.message, "messages": self.messages}
+
+        # '직통' 채널 (QtBus의 LogSignals와 API를 맞춤)
+        # 시그널 기계 장치 없이 발신 스레드에서 동기로 호출되는 콜백 리스트
+        self._direct: list = []
+
+    def connect_direct(self, fn) -> None:
+        """직통 채널 구독"""
+        if fn not in self._direct:
+            self._direct.append(fn)
+
+    def disconnect_direct(self, fn=None) -> None:
+        """직통 채널 구독 해제 (None이면 전부 해제)"""
+        if fn is None:
+            self._direct.clear()
+        elif fn in self._direct:
+            self._direct.remove(fn)
+
+    def emit_direct(self, source: str, message: str, level: str) -> None:
+        """직통 구독자들만 동기로 호출한다."""
+        for fn in self._direct:
+            fn(source, message, level)
+
+
+class _Data:
+    __slots__ = ("sequence_activity_changed", "sequence_data_loaded", "_signals")
+
+    def __init__(self):
+        self.sequence_activity_changed = SimpleSignal()
+        self.sequence_data_loaded = SimpleSignal()
+        self._signals = {
+            "sequence_activity_changed": self.sequence_activity_changed,
+            "sequence_data_loaded": self.sequence_data_loaded,
+        }
+
+
+class _System:
+    __slots__ = ("system_error_occurred", "system_notification_received", "_signals")
+
+    def __init__(self):
+        self.system_error_occurred = SimpleSignal()
+        self.system_notification_received = SimpleSignal()
+        self._signals = {
+            "system_error_occurred": self.system_error_occurred,
+            "system_notification_received": self.system_notification_received,
+        }
+
+
+# =============================================================================
+# 메인 클래스
+# =============================================================================
+class SimpleEventBus:
+    """
+    Qt가 없을 때 대신 사용하는 이벤트 버스이다.
+    사용법은 QtEventBus와 99% 동일하게 만들어서,
+    코드를 고치지 않고도 환경을 오갈 수 있게 한다.
+    """
+
+    def __init__(self):
+        # 각 그룹별로 SimpleSignal들을 생성하여 배치한다.
+        self.system = _System()
+        self.log = _Log()
+        self.data = _Data()
+
+        # 전체 관리를 위한 리스트
+        self._signal_groups = [self.system, self.log, self.data]
+
+        # 시그널 이름표: 각 그룹이 자신의 시그널을 _signals 사전으로 알려주므로
+        # dir() + isinstance 탐색 없이 바로 모은다.
+        # 형태: [(시그널이름, 시그널객체), ...]
+        self._simple_sig_table: list[tuple[str, SimpleSignal]] = []
+
+        # 구독 비트맵: i번째 비트가 1이면 '_simple_sig_table[i] 시그널에
+        # 구독자가 1명 이상 있다'는 뜻. emit 전에 int 비교 한 번으로
+        # "들을 사람이 있나?"를 알 수 있다.
+        self._subscribed = 0
+        self._log_mask = 0  # 로그 그룹 시그널들에 해당하는 비트 묶음
+
+        for group in self._signal_groups:
+            for attr, sig in group._signals.items():
+                idx = len(self._simple_sig_table)
+                self._simple_sig_table.append((attr, sig))
+
+                # 시그널이 0명 <-> 1명 이상으로 전환될 때 비트맵을 갱신하게 연결
+                sig._watch_idx = idx
+                sig._watcher = self._on_subscription_changed
+                if group is self.log:
+                    self._log_mask |= 1 << idx
+
+    def _on_subscription_changed(self, idx: int, has_subscribers: bool) -> None:
+        """시그널의 구독자 수가 0명 <-> 1명 이상으로 바뀔 때 비트맵을 갱신한다."""
+        if has_subscribers:
+            self._subscribed |= 1 << idx
+        else:
+            self._subscribed &= ~(1 << idx)
+
+    def any_log_subscribers(self) -> bool:
+        """로그 시그널에 구독자가 하나라도 있는지 (int AND 한 번으로 확인)"""
+        return bool(self._subscribed & self._log_mask)
+
+    def disconnect_all(self, signal_name: str | None = None) -> None:
+        """
+        모든 연결을 끊어버린다. (초기화나 종료 시 유용)
+        """
+        for group in self._signal_groups:
+            sigs = group._signals
+            if signal_name is None:
+                # 전부 싹둑
+                for sig in sigs.values():
+                    sig.disconnect()
+            elif (sig := sigs.get(signal_name)) is not None:
+                # 이름으로 O(1) 조회 후 싹둑
+                sig.disconnect()
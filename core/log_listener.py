@@ -1,71 +1,164 @@
-# logging/log_listener.py
-"""
-[로그 리스너 (Log Listener)]
-
-EventBus에서 날아오는 '로그 이벤트(log.message)'를 잡아서,
-실제 '로거(Logger)'에게 전달하는 중재자(Mediator) 역할이다.
-
-장점:
-    1. Logger는 EventBus나 Qt를 몰라도 된다. (순수 파이썬 로거 유지)
-    2. EventBus는 로깅이 어떻게 되는지 몰라도 된다. (그저 신호만 보낼 뿐)
-    3. 이 녀석이 중간에서 둘을 이어준다. -> 결합도 감소!
-"""
-from __future__ import annotations
-
-from typing import Any
-
-# TODO: 실제 프로젝트의 logger 모듈 위치로 수정이 필요할 수 있다.
-# 지금은 표준 logging 모듈을 가져와서 사용한다.
-
-
-class LogListener:
-    def __init__(self, bus: Any):
-        """
-        리스너를 생성하면서 EventBus에 귀를 기울인다(connect).
-
-        Args:
-            bus (Any): EventBus 객체 (QtBus든 SimpleBus든 상관없음)
-        """
-        # [중요] 여기서 'LogListener'라는 이름의 로거를 달라고 요청한다.
-        # utilities.logger.get_logger를 사용해야 우리가 설정한(Logger.initialize) 로거의 설정을 물려받을 수 있다.
-        # 그냥 logging.getLogger("Name")을 쓰면 설정되지 않은 '쌩' 로거를 받게 되어 로그가 증발한다.
-        from utilities.logger import get_logger
-
-        self.logger = get_logger("LogListener")
-        self._bus = bus
-
-        # 핵심!
-        # 버스의 log.message 채널에 내 귀(on_log_message)를 연결한다.
-        # 이제 누가 버스에 대고 "로그 남겨줘!"라고 외치면 on_log_message가 실행된다.
-        self._bus.log.message.connect(self.on_log_message)
-
-        self.logger.info("LogListener initialized (로그 리스너가 시작되었다)")
-
-    def on_log_message(self, source: str, message: str, level: str):
-        """
-        실제 로그 이벤트가 발생했을 때 호출되는 함수(Slot)이다.
-
-        Args:
-            source (str): 로그를 보낸 녀석 (예: "MainView", "ScannerSvc")
-            message (str): 로그 내용
-            level (str): 중요도 ("DEBUG", "INFO", "ERROR" 등)
-        """
-        level_upper = level.upper()
-
-        # 보기 좋게 포맷팅: "[보낸곳] 내용"
-        formatted_message = f"[{source}] {message}"
-
-        # 레벨에 맞춰서 실제 로거에게 기록을 명령한다.
-        if level_upper == "DEBUG":
-            self.logger.debug(formatted_message)
-        elif level_upper == "INFO":
-            self.logger.info(formatted_message)
-        elif level_upper == "WARNING":
-            self.logger.warning(formatted_message)
-        elif level_upper == "ERROR":
-            self.logger.error(formatted_message)
-        elif level_upper == "CRITICAL":
-            self.logger.critical(formatted_message)
-        else:
-            # 듣도 보도 못한 레벨이 오면 그냥 INFO로 처리하면서 레벨 이름을 앞에 붙여준다.
-            self.logger.info(f"[{level}] {formatted_message}")
+# logging/log_listener.py
+"""
+[로그 리스너 (Log Listener)]
+
+EventBus에서 날아오는 '로그 이벤트(log.message)'를 잡아서,
+실제 '로거(Logger)'에게 전달하는 중재자(Mediator) 역할이다.
+
+장점:
+    1. Logger는 EventBus나 Qt를 몰라도 된다. (순수 파이썬 로거 유지)
+    2. EventBus는 로깅이 어떻게 되는지 몰라도 된다. (그저 신호만 보낼 뿐)
+    3. 이 녀석이 중간에서 둘을 이어준다. -> 결합도 감소!
+"""
+from __future__ import annotations
+
+import logging
+import sys
+from collections import deque
+from typing import Any, Optional
+
+from utilities.logger import get_logger
+
+# 로그 레벨 문자열 -> 숫자 매핑 (모듈 로드 시 단 한 번 준비)
+# 호출부가 보통 대문자 상수를 그대로 넘기므로 upper() 없이 바로 적중한다.
+# 키를 sys.intern으로 인턴해두면, 발신부가 같은 인턴 상수를 넘길 때
+# dict 조회가 '포인터 비교 한 번'으로 적중한다. (해시도 캐시됨)
+_LEVELS = {
+    sys.intern("DEBUG"): 10,
+    sys.intern("INFO"): 20,
+    sys.intern("WARNING"): 30,
+    sys.intern("ERROR"): 40,
+    sys.intern("CRITICAL"): 50,
+}
+
+# 모듈 단위 로거 캐시. 리스너를 여러 번 만들어도 get_logger는 한 번만 불린다.
+# ⚠️ import 시점에 바로 get_logger를 호출하면 안 된다!
+#    이 모듈은 Logger.initialize보다 먼저 import되므로, 그 시점에 받으면
+#    설정 없는 '쌩' 로거가 캐시되어 로그가 증발한다. 첫 리스너 생성 때 채운다.
+_LOGGER: Optional[logging.Logger] = None
+
+# TODO: 실제 프로젝트의 logger 모듈 위치로 수정이 필요할 수 있다.
+# 지금은 표준 logging 모듈을 가져와서 사용한다.
+
+
+class LogListener:
+    def __init__(self, bus: Any):
+        """
+        리스너를 생성하면서 EventBus에 귀를 기울인다(connect).
+
+        Args:
+            bus (Any): EventBus 객체 (QtBus든 SimpleBus든 상관없음)
+        """
+        # [중요] 여기서 'LogListener'라는 이름의 로거를 달라고 요청한다.
+        # utilities.logger.get_logger를 사용해야 우리가 설정한(Logger.initialize) 로거의 설정을 물려받을 수 있다.
+        # 그냥 logging.getLogger("Name")을 쓰면 설정되지 않은 '쌩' 로거를 받게 되어 로그가 증발한다.
+        global _LOGGER
+        if _LOGGER is None:
+            _LOGGER = get_logger("LogListener")
+
+        self.logger = _LOGGER
+        self._bus = bus
+
+        # 자주 부르는 바운드 메서드들을 미리 잡아둔다.
+        # - _log_fn: 로그 기록은 전부 Logger.log(정수레벨, ...) 단일 진입점으로
+        # - _enabled_for: emit마다 self.logger.isEnabledFor 속성 조회 비용 제거
+        self._log_fn = self.logger.log
+        self._enabled_for = self.logger.isEnabledFor
+
+        # [배치 처리]
+        # 워커가 타이트한 루프에서 로그를 쏟아내면, 이벤트 1건마다 GUI 스레드를
+        # 깨우는 대신 deque에 쌓아뒀다가 타이머 틱(16ms)마다 한꺼번에 기록한다.
+        # (deque.append는 GIL 아래에서 원자적이라 어느 스레드에서 불러도 안전)
+        # Qt 이벤트 루프가 없는 환경(SimpleEventBus 단독 테스트 등)에서는
+        # 타이머를 돌릴 수 없으므로 기존처럼 동기로 바로 기록한다.
+        self._queue: deque = deque()
+        self._timer = None
+
+        if self._start_batch_timer():
+            # 발신 스레드에서는 튜플 append 한 번이 전부 (싸다!)
+            self._bus.log.message.connect(self._enqueue)
+        else:
+            self._bus.log.message.connect(self.on_log_message)
+
+        # 배치 채널(messages: 튜플 리스트 1건으로 N건 운반)도 구독한다.
+        # 발신부 배처가 지속 부하에서 이 채널로 갈아타므로 놓치면 안 된다.
+        messages = getattr(self._bus.log, "messages", None)
+        if messages is not None:
+            messages.connect(self.on_log_batch)
+
+        # '직통' 채널도 구독한다. (버스가 지원하는 경우)
+        # Qt Signal을 우회해 보낸 로그(emit_direct)도 stdlib 로거에 도달해야 한다.
+        connect_direct = getattr(self._bus.log, "connect_direct", None)
+        if connect_direct is not None:
+            connect_direct(self.on_log_message)
+
+        self.logger.info("LogListener initialized (로그 리스너가 시작되었다)")
+
+    def _start_batch_timer(self, interval_ms: int = 16) -> bool:
+        """
+        GUI 스레드에서 큐를 비워줄 QTimer를 시작한다.
+        Qt가 없거나 앱(QCoreApplication)이 아직 없으면 False를 돌려준다.
+        """
+        try:
+            from PySide6.QtCore import QCoreApplication, QTimer
+        except ImportError:
+            return False
+
+        if QCoreApplication.instance() is None:
+            return False
+
+        self._timer = QTimer()
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+        self._timer.start()
+        return True
+
+    def _enqueue(self, source: str, message: str, level: str):
+        """발신 스레드에서 실행되는 수신부: 큐에 넣기만 하고 바로 리턴한다."""
+        self._queue.append((source, message, level))
+
+    def _flush(self):
+        """타이머 틱마다 GUI 스레드에서 실행: 쌓인 로그를 한꺼번에 기록한다."""
+        q = self._queue
+        while q:
+            source, message, level = q.popleft()
+            self.on_log_message(source, message, level)
+
+    def on_log_batch(self, batch: list):
+        """배치 시그널 수신부: [(source, message, level), ...]를 순서대로 기록한다."""
+        # 타이머 모드에서는 단건(_enqueue)과 같은 큐를 타야 한다.
+        # 배치만 즉시 기록하면 먼저 도착해 큐에서 대기 중인 단건들을
+        # 추월해서 파일에 역순으로 남는다.
+        if self._timer is not None:
+            self._queue.extend(batch)
+            return
+
+        on_one = self.on_log_message
+        for source, message, level in batch:
+            on_one(source, message, level)
+
+    def on_log_message(self, source: str, message: str, level: str):
+        """
+        실제 로그 이벤트가 발생했을 때 호출되는 함수(Slot)이다.
+
+        Args:
+            source (str): 로그를 보낸 녀석 (예: "MainView", "ScannerSvc")
+            message (str): 로그 내용
+            level (str): 중요도 ("DEBUG", "INFO", "ERROR" 등)
+        """
+        # dict 한 번 조회로 레벨 숫자를 얻는다.
+        # 호출부가 이미 대문자("INFO" 등)를 주는 게 보통이므로 upper()는 미스일 때만.
+        lvl = _LEVELS.get(level)
+        if lvl is None and not level.isupper():
+            lvl = _LEVELS.get(level.upper())
+
+        if lvl is None:
+            # 듣도 보도 못한 레벨이 오면 그냥 INFO로 처리하면서 레벨 이름을 앞에 붙여준다.
+            if self._enabled_for(logging.INFO):
+                self._log_fn(logging.INFO, "[%s] [%s] %s", level, source, message)
+            return
+
+        # 레벨 미달이면 포맷팅 비용을 쓰기 전에 바로 버린다.
+        if self._enabled_for(lvl):
+            # %-스타일을 쓰면 실제 출력 시점에만 문자열이 만들어진다.
+            self._log_fn(lvl, "[%s] %s", source, message)
@@ -1,28 +1,42 @@
-# styles/style_manager.py
-from pathlib import Path
-
-from PySide6.QtWidgets import QApplication, QWidget
-
-from utilities.file_handler import load_text
-
-
-def apply_stylesheet(target: QWidget | QApplication, path: Path) -> None:
-    """
-    스타일시티(QSS) 파일을 읽어 적용
-
-    Args:
-        target: 스타일을 적용할 위젯 또는 QApplication 객체.
-        path: 읽어올 QSS 파일의 경로
-    """
-
-    # 스타일시트 읽기 - qss 파일의 형태는 텍스트 문자열
-    stylesheet_content = load_text(path)
-
-    # 타겟에 가져온 스타일시트 적용
-    target.setStyleSheet(stylesheet_content)
-
-
-def apply_theme(app: QApplication, theme_name="default"):
-    """테마 관리 기능(다크/라이트 모드)"""
-
-    # TODO: 테마 관리 기능 추가하기
+# styles/style_manager.py
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from utilities.file_handler import load_text
+
+
+def apply_stylesheet(target: QWidget | QApplication, path: str | Path) -> None:
+    """
+    스타일시티(QSS) 파일을 읽어 적용
+
+    Args:
+        target: 스타일을 적용할 위젯 또는 QApplication 객체.
+        path: 읽어올 QSS 파일의 경로 (str 또는 Path)
+    """
+
+    # 스타일시트 읽기 - qss 파일의 형태는 텍스트 문자열
+    stylesheet_content = load_text(path)
+
+    # 타겟에 가져온 스타일시트 적용
+    apply_stylesheet_text(target, stylesheet_content)
+
+
+def apply_stylesheet_text(target: QWidget | QApplication, css_text: str) -> None:
+    """
+    이미 읽어둔 QSS 문자열을 적용
+
+    파일을 미리(예: 백그라운드 스레드에서) 읽어둔 경우,
+    같은 파일을 두 번 읽지 않고 이 함수로 바로 적용할 수 있다.
+
+    Args:
+        target: 스타일을 적용할 위젯 또는 QApplication 객체.
+        css_text: QSS 텍스트 내용
+    """
+    target.setStyleSheet(css_text)
+
+
+def apply_theme(app: QApplication, theme_name="default"):
+    """테마 관리 기능(다크/라이트 모드)"""
+
+    # TODO: 테마 관리 기능 추가하기
@@ -1,52 +1,108 @@
-from typing import Generic, TypeVar
-
-from PySide6.QtWidgets import QWidget
-
-from core.events.qt_bus import EVENT_BUS
-
-# 제네릭 타입을 사용하여 구체적인 ViewModel 타입을 명시할 수 있게 한다.
-T = TypeVar("T")
-
-
-class BaseView(QWidget, Generic[T]):
-    """
-    모든 View(Widget)의 기본 클래스이다.
-    ViewModel을 연결하고 관리하는 공통 로직을 포함한다.
-    """
-
-    def __init__(self, view_model: T | None):
-        super().__init__()
-        self.view_model = view_model
-
-        # 로그 소스 이름 설정 (클래스 이름 자동 사용)
-        self.log_source = self.__class__.__name__
-
-        self.init_ui()
-        self.init_bindings()
-
-    # ==========================================================
-    # [외부 접근] 로깅
-    # ==========================================================
-    def log(self, message: str, level: str = "INFO"):
-        """EventBus를 통해 로그를 전송한다."""
-        EVENT_BUS.log.message.emit(self.log_source, message, level)
-
-    def log_info(self, message: str):
-        self.log(message, "INFO")
-
-    def log_warning(self, message: str):
-        self.log(message, "WARNING")
-
-    def log_error(self, message: str):
-        self.log(message, "ERROR")
-
-    def log_debug(self, message: str):
-        self.log(message, "DEBUG")
-
-    def init_ui(self):
-        """UI 컴포넌트를 초기화하고 레이아웃을 구성한다."""
-        raise NotImplementedError("하위 클래스에서 구현해야 한다.")
-
-    def init_bindings(self):
-        """ViewModel의 시그널과 View의 슬롯을 연결한다."""
-        pass
+from typing import TypeVar
+
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import QWidget
+
+from core.events.qt_bus import EVENT_BUS
+from utilities.logger import Logger
+from utilities.qt_throttle import qthrottled
+
+# 로그 레벨 문자열 -> 숫자 (emit 전 가드용)
+_LEVEL_MAP = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# 제네릭 타입을 사용하여 구체적인 ViewModel 타입을 명시할 수 있게 한다.
+T = TypeVar("T")
+
+
+class BaseView(QWidget):
+    """
+    모든 View(Widget)의 기본 클래스이다.
+    ViewModel을 연결하고 관리하는 공통 로직을 포함한다.
+    """
+
+    # 타입 표기용 구독(BaseView[MyViewModel])을 런타임 비용 없이 허용한다.
+    # Generic[T]를 실제로 상속하면 서브클래스를 정의할 때마다
+    # typing._GenericAlias가 만들어지는데, 그 기계 장치 없이 클래스 자신을
+    # 돌려주는 것으로 충분하다. (타입 검사기는 시그니처의 T로 추론한다)
+    __class_getitem__ = classmethod(lambda cls, _item: cls)
+
+    # ⚠️ 여기에 __slots__를 선언하면 안 된다!
+    # Shiboken(QWidget/QObject) 파생 클래스에 __slots__를 붙이면 첫 슬롯
+    # 대입에서 메모리 손상/세그폴트가 난다. 게다가 Shiboken 인스턴스는
+    # 어차피 __dict__를 유지하므로 메모리 절약도 없다.
+
+    # 로그 소스 이름 (클래스 이름 자동 사용)
+    # 인스턴스마다 대입하지 않고 __init_subclass__에서 클래스당 한 번만 계산한다.
+    log_source = "BaseView"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.log_source = cls.__name__
+
+    def __init__(self, view_model: T | None):
+        super().__init__()
+        self.view_model = view_model
+
+        # 로그 폭주(버스트) 대비: emit을 50ms 배치 창으로 묶는다.
+        # 한 창 안에 몰린 로그들은 타이머 틱 한 번에 순서대로 전달된다.
+        self._emit_log = qthrottled(
+            EVENT_BUS.log.message.emit,
+            timeout=50,
+            parent=self,
+            # 한 창에 로그가 쏟아지면 단건 시그널 N회 대신 배치 시그널 1회로
+            batch_fn=EVENT_BUS.log.messages.emit,
+        )
+
+        # 레벨별 헬퍼는 emit까지 한 프레임에 가는 클로저로 미리 바인딩한다.
+        # (log_info -> log -> emit 3프레임이던 것을 1프레임으로 축소)
+        # Logger.current_level 가드: 꺼진 레벨이면 int 비교 한 번으로 끝난다.
+        emit = self._emit_log
+        src = self.log_source
+        self.log_info = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "INFO") if Logger.current_level <= 20 else None
+        )
+        self.log_warning = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "WARNING") if Logger.current_level <= 30 else None
+        )
+        self.log_error = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "ERROR") if Logger.current_level <= 40 else None
+        )
+        self.log_debug = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "DEBUG") if Logger.current_level <= 10 else None
+        )
+
+        # ⚠️ 여기서 init_ui()/init_bindings()를 부르지 않는다!
+        # 하위 클래스 __init__ 본문이 끝나기 전에 UI를 만들면, 하위 클래스가
+        # 아직 준비하지 못한 속성(self.*)을 init_ui가 건드리는 순서 문제가 생긴다.
+        # 하위 클래스는 자기 상태를 전부 채운 뒤 self.setup()을 호출한다.
+
+    def setup(self) -> None:
+        """
+        UI 구성과 바인딩을 실행한다.
+
+        하위 클래스가 __init__ 마지막 줄에서 호출한다. (BaseWidget 참고)
+        이렇게 분리하면 init_ui()가 실행되는 시점에 인스턴스 상태가
+        완성돼 있음이 보장된다.
+        """
+        self.init_ui()
+        self.init_bindings()
+
+    # ==========================================================
+    # [외부 접근] 로깅
+    # ==========================================================
+    # @Slot을 붙여두면 Qt가 connect 시점에 동적 슬롯을 QMetaObject에
+    # 등록하는 비용을 피하고, 시그널 디스패치도 더 빠른 경로를 탄다.
+    @Slot(str, str)
+    def log(self, message: str, level: str = "INFO"):
+        """EventBus를 통해 로그를 전송한다. (배치 창 단위로 묶어서)"""
+        if _LEVEL_MAP.get(level, 20) < Logger.current_level:
+            return  # 어차피 버려질 레벨 -> emit 비용 자체를 건너뛴다
+        self._emit_log(self.log_source, message, level)
+
+    def init_ui(self):
+        """UI 컴포넌트를 초기화하고 레이아웃을 구성한다."""
+        raise NotImplementedError("하위 클래스에서 구현해야 한다.")
+
+    def init_bindings(self):
+        """ViewModel의 시그널과 View의 슬롯을 연결한다."""
+        pass
@@ -1,109 +1,181 @@
-from typing import Generic, TypeVar
-
-
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QMenuBar
-from PySide6.QtGui import QIcon, QAction, QKeySequence
-
-from config.app_config import APP_CONFIG
-from core.events.qt_bus import EVENT_BUS
-
-# 제네릭 타입 정의
-T = TypeVar("T")
-
-class MainWindow(QMainWindow, Generic[T]):
-    """
-    메인 윈도우 UI 클래스
-    
-    특징:
-    - QMainWindow 상속
-    - ViewModel과 바인딩
-    - 메뉴바 및 상태바 포함
-    """
-    def __init__(self, view_model: T):
-        super().__init__()
-        self.view_model = view_model
-        
-        # 로그 소스 이름 설정
-        self.log_source = self.__class__.__name__
-        
-        self.init_ui()
-        self.init_bindings()
-        
-    def init_ui(self):
-        """UI 초기화"""
-        self.setObjectName("main_window")
-        self.setWindowTitle(APP_CONFIG.app_name)
-        self.resize(1024, 768)
-        
-        # 아이콘 설정
-        icon_path = APP_CONFIG.paths.APP_ICON
-        
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
-        
-        # Central Widget 설정
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # 기본 레이아웃 및 위젯 (테스트용)
-        layout = QVBoxLayout(central_widget)
-        
-        label = QLabel("Main Window Initialized")
-        layout.addWidget(label)
-        
-        # 메뉴바 설정
-        self._setup_menu_bar()
-        
-        # 상태바 설정
-        self.statusBar().showMessage("Ready")
-        
-        self.log_info("메인 윈도우 UI 초기화 완료")
-
-    def _setup_menu_bar(self):
-        """메뉴바 및 액션 구성"""
-        menu_bar = self.menuBar()
-        menu_bar.setObjectName("menu_bar")
-        
-        # [File] 메뉴
-        file_menu = menu_bar.addMenu("&File")
-        
-        # [File] 메뉴 - Exit 액션
-        exit_action = QAction("&Exit", self)
-        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
-        exit_action.setStatusTip("Exit application")
-        exit_action.triggered.connect(self.close)
-        
-        file_menu.addAction(exit_action)
-        
-        # [Help] 메뉴
-        help_menu = menu_bar.addMenu("&Help")
-        
-        # [Help] 메뉴 - About 액션
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
-
-    def init_bindings(self):
-        """ViewModel 시그널 바인딩"""
-        pass
-
-    def _show_about(self):
-        self.log_info("About 메뉴 클릭됨")
-        # TODO: About 다이얼로그 표시
-
-    # --- 로깅 헬퍼 메서드 ---
-    def log(self, message: str, level: str = "INFO"):
-        """EventBus를 통해 로그를 전송한다."""
-        EVENT_BUS.log.message.emit(self.log_source, message, level)
-
-    def log_info(self, message: str):
-        self.log(message, "INFO")
-        
-    def log_warning(self, message: str):
-        self.log(message, "WARNING")
-        
-    def log_error(self, message: str):
-        self.log(message, "ERROR")
-
-    def log_debug(self, message: str):
-        self.log(message, "DEBUG")
+import os
+from functools import lru_cache
+from typing import TypeVar
+
+
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QMenuBar
+from PySide6.QtGui import QIcon, QAction, QKeySequence
+
+from config.app_config import APP_CONFIG
+from core.events.qt_bus import EVENT_BUS
+from utilities.logger import Logger
+from utilities.qt_throttle import qthrottled
+
+
+# 로그 레벨 문자열 -> 숫자 (emit 전 가드용)
+_LEVEL_MAP = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+# 제네릭 타입 정의
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=32)
+def _load_icon(path: str) -> QIcon:
+    """
+    아이콘을 경로별로 한 번만 읽어서 캐시한다.
+
+    QIcon 생성은 디스크 읽기 + 이미지 디코딩 비용이 든다. 창을 여러 개
+    띄우는 흐름이나 테스트 하네스에서 같은 아이콘을 반복 로드하지 않도록.
+    """
+    return QIcon(path)
+
+class MainWindow(QMainWindow):
+    """
+    메인 윈도우 UI 클래스
+    
+    특징:
+    - QMainWindow 상속
+    - ViewModel과 바인딩
+    - 메뉴바 및 상태바 포함
+    """
+
+    # 타입 표기용 구독을 런타임 비용 없이 허용 (BaseView와 동일한 이유)
+    __class_getitem__ = classmethod(lambda cls, _item: cls)
+    # 로그 소스 이름 (클래스 이름 자동 사용, 클래스당 한 번만 계산)
+    log_source = "MainWindow"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.log_source = cls.__name__
+
+    def __init__(self, view_model: T):
+        super().__init__()
+        self.view_model = view_model
+
+        # 로그 폭주(버스트) 대비: emit을 50ms 배치 창으로 묶는다.
+        self._emit_log = qthrottled(
+            EVENT_BUS.log.message.emit,
+            timeout=50,
+            parent=self,
+            # 한 창에 로그가 쏟아지면 단건 시그널 N회 대신 배치 시그널 1회로
+            batch_fn=EVENT_BUS.log.messages.emit,
+        )
+
+        # 레벨별 헬퍼는 emit까지 한 프레임에 가는 클로저로 미리 바인딩한다.
+        # Logger.current_level 가드: 꺼진 레벨이면 int 비교 한 번으로 끝난다.
+        emit = self._emit_log
+        src = self.log_source
+        self.log_info = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "INFO") if Logger.current_level <= 20 else None
+        )
+        self.log_warning = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "WARNING") if Logger.current_level <= 30 else None
+        )
+        self.log_error = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "ERROR") if Logger.current_level <= 40 else None
+        )
+        self.log_debug = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "DEBUG") if Logger.current_level <= 10 else None
+        )
+
+        # 무거운 구성(finalize)이 이미 실행됐는지 여부
+        self._finalized = False
+
+        # 상태를 전부 채운 뒤에야 UI 뼈대를 만든다 (BaseView.setup과 같은 규약)
+        self.setup()
+
+    def setup(self):
+        """UI 구성 진입점 (무거운 부분은 finalize가 담당)"""
+        self.init_ui()
+
+    def init_ui(self):
+        """
+        UI '뼈대'만 초기화한다.
+
+        창이 한 프레임 안에 화면에 뜰 수 있도록 여기서는 제목/크기 같은
+        가벼운 설정만 하고, 메뉴바·콘텐츠 등 무거운 구성은 finalize()로 미룬다.
+        (main.py가 show() 직후 QTimer.singleShot(0, finalize)로 예약한다)
+        """
+        self.setObjectName("main_window")
+        self.setWindowTitle(APP_CONFIG.app_name)
+        self.resize(1024, 768)
+
+    def finalize(self):
+        """
+        첫 페인트가 끝난 뒤(유휴 틱) 호출되어 나머지 UI를 구성한다.
+        이벤트 루프가 먼저 창을 그리게 양보해서 체감 시작 속도를 올린다.
+        """
+        if self._finalized:
+            return
+        self._finalized = True
+
+        # 아이콘 설정 (경로는 str로 보관되므로 os.path로 검사)
+        icon_path = APP_CONFIG.paths.APP_ICON
+
+        if os.path.exists(icon_path):
+            self.setWindowIcon(_load_icon(icon_path))
+
+        # Central Widget 설정
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        # 기본 레이아웃 및 위젯 (테스트용)
+        layout = QVBoxLayout(central_widget)
+
+        label = QLabel("Main Window Initialized")
+        layout.addWidget(label)
+
+        # 메뉴바 설정
+        self._setup_menu_bar()
+
+        # 상태바 설정
+        self.statusBar().showMessage("Ready")
+
+        # ViewModel 바인딩도 콘텐츠가 갖춰진 뒤에 연결
+        self.init_bindings()
+
+        self.log_info("메인 윈도우 UI 초기화 완료")
+
+    def _setup_menu_bar(self):
+        """메뉴바 및 액션 구성"""
+        menu_bar = self.menuBar()
+        menu_bar.setObjectName("menu_bar")
+        
+        # [File] 메뉴
+        file_menu = menu_bar.addMenu("&File")
+        
+        # [File] 메뉴 - Exit 액션
+        exit_action = QAction("&Exit", self)
+        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
+        exit_action.setStatusTip("Exit application")
+        exit_action.triggered.connect(self.close)
+        
+        file_menu.addAction(exit_action)
+        
+        # [Help] 메뉴
+        help_menu = menu_bar.addMenu("&Help")
+        
+        # [Help] 메뉴 - About 액션
+        about_action = QAction("&About", self)
+        about_action.triggered.connect(self._show_about)
+        help_menu.addAction(about_action)
+
+    def init_bindings(self):
+        """ViewModel 시그널 바인딩"""
+        pass
+
+    @Slot()
+    def _show_about(self):
+        self.log_info("About 메뉴 클릭됨")
+        # TODO: About 다이얼로그 표시
+
+    # --- 로깅 헬퍼 메서드 ---
+    # @Slot 덕분에 connect 시 동적 슬롯 등록 비용이 없다 (정적 메타슬롯 사용)
+    @Slot(str, str)
+    def log(self, message: str, level: str = "INFO"):
+        """EventBus를 통해 로그를 전송한다. (배치 창 단위로 묶어서)"""
+        if _LEVEL_MAP.get(level, 20) < Logger.current_level:
+            return  # 어차피 버려질 레벨 -> emit 비용 자체를 건너뛴다
+        self._emit_log(self.log_source, message, level)
+
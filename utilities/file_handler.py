@@ -1,69 +1,175 @@
-# utilities/file_handler.py
-"""
-파일 입출력 유틸리티(단순 도구)
-
-예외 발생 시 FileOperationError로 감싸서 호출부에 던진다
-
-호출부는 try-except로 처리한다
-"""
-
-import csv
-import json
-from pathlib import Path
-from typing import Any, Dict, List
-
-from utilities.file_exceptions import FileOperationError
-
-
-# --- JSON --- #
-def load_json(path: Path) -> Dict[str, Any]:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        raise FileOperationError("JSON 로드 실패", e, path) from e
-
-
-def save_json(path: Path, data: Dict[str, Any]) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-    except Exception as e:
-        raise FileOperationError("JSON 저장 실패", e, path) from e
-
-
-# --- 텍스트(문자열) --- #
-def load_text(path: Path) -> str:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
-    except Exception as e:
-        raise FileOperationError("텍스트 로드 실패", e, path) from e
-
-
-def save_text(path: Path, data: str) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(data)
-    except Exception as e:
-        raise FileOperationError("텍스트 저장 실패", e, path) from e
-
-
-# --- CSV --- #
-def load_csv(path: Path) -> List[List[str]]:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return [row for row in csv.reader(f)]
-    except Exception as e:
-        raise FileOperationError("CSV 로드 실패", e, path) from e
-
-
-def save_csv(path: Path, data: List[List[str]]) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8", newline="") as f:
-            csv.writer(f).writerows(data)
-    except Exception as e:
-        raise FileOperationError("CSV 저장 실패", e, path) from e
+# utilities/file_handler.py
+"""
+파일 입출력 유틸리티(단순 도구)
+
+예외 발생 시 FileOperationError로 감싸서 호출부에 던진다
+
+호출부는 try-except로 처리한다
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from utilities.file_exceptions import FileOperationError
+
+# orjson(C 확장)이 있으면 JSON 파싱/직렬화가 수 배 빨라진다.
+# 선택 의존성이므로 없으면 조용히 표준 json으로 동작한다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow(C 벡터화 파서)가 있으면 CSV 로드가 한 자릿수 배 빨라진다.
+# 역시 선택 의존성 - 없으면 표준 csv 모듈로 동작한다.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    임시 파일에 전부 쓴 뒤 os.replace로 원자적으로 바꿔치기한다.
+
+    저장 도중 크래시가 나도 기존 파일이 잘린 채로 남지 않는다.
+    (os.replace는 POSIX/Windows 모두에서 원자적)
+    쓰기도 완성된 bytes 한 덩어리를 단일 write로 내보낸다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        # 실패 시 임시 파일을 남기지 않는다
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# --- JSON --- #
+def load_json(path: Path) -> Dict[str, Any]:
+    try:
+        if orjson is not None:
+            # 바이트를 통째로 읽어 C 파서에 넘긴다 (텍스트 디코딩 경유 없음)
+            return orjson.loads(Path(path).read_bytes())
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        # ValueError가 json.JSONDecodeError / orjson.JSONDecodeError /
+        # UnicodeDecodeError를 전부 포괄한다. 프로그래밍 오류는 그대로 전파.
+        raise FileOperationError("JSON 로드 실패", e, path) from e
+
+
+def save_json(path: Path, data: Dict[str, Any]) -> None:
+    try:
+        if orjson is not None:
+            # 한 방에 bytes로 직렬화 (들여쓰기는 orjson 규격상 2칸)
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+        _atomic_write_bytes(path, payload)
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError: 직렬화 불가 객체 (orjson의 JSONEncodeError는 TypeError 하위)
+        raise FileOperationError("JSON 저장 실패", e, path) from e
+
+
+# --- 텍스트(문자열) --- #
+def load_text(path: str | Path) -> str:
+    try:
+        # mmap으로 커널 페이지 캐시를 그대로 보고 디코딩 한 번만 한다.
+        # (f.read()처럼 파이썬 bytes 중간 사본을 만들지 않는다)
+        with open(path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:].decode("utf-8")
+            except ValueError:
+                # 빈 파일(길이 0)은 mmap이 불가능하다
+                return f.read().decode("utf-8")
+    except (OSError, ValueError) as e:
+        # ValueError는 UnicodeDecodeError 포괄
+        raise FileOperationError("텍스트 로드 실패", e, path) from e
+
+
+def save_text(path: Path, data: str) -> None:
+    try:
+        _atomic_write_bytes(path, data.encode("utf-8"))
+    except (OSError, ValueError) as e:
+        # ValueError는 UnicodeEncodeError(서러게이트 등) 포괄
+        raise FileOperationError("텍스트 저장 실패", e, path) from e
+
+
+# --- CSV --- #
+def _load_csv_arrow(path: Path) -> List[List[str]]:
+    """
+    pyarrow의 C 벡터화 파서로 CSV를 읽는다.
+
+    load_csv와 같은 '전부 문자열인 행 리스트' 계약을 지키기 위해
+    헤더 추론을 끄고 모든 컬럼을 string 타입으로 고정한다.
+    (타입 추론에 맡기면 "01" -> 1 같은 손실 변환이 생긴다)
+    """
+    # 첫 '레코드'를 csv 파서로 완전하게 읽어 컬럼 수를 센다.
+    # readline() 한 줄만 보면 따옴표 안에 개행이 든 첫 레코드가 잘려서
+    # ncols가 모자라게 나오고, 남은 컬럼들이 Arrow 타입 추론으로 넘어가
+    # "01" -> 1 같은 손실 변환이 조용히 일어난다.
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        first_row = next(csv.reader(f), None)
+    if first_row is None:
+        return []
+
+    # 컬럼 수만큼 자동 생성 이름(f0, f1, ...)에 string 타입을 박는다
+    ncols = len(first_row)
+    table = pa_csv.read_csv(
+        str(path),
+        read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={f"f{i}": pa.string() for i in range(ncols)},
+            strings_can_be_null=False,
+        ),
+    )
+    columns = [col.to_pylist() for col in table.columns]
+    return [list(row) for row in zip(*columns)]
+
+
+def load_csv(path: Path) -> List[List[str]]:
+    try:
+        if pa_csv is not None:
+            try:
+                return _load_csv_arrow(Path(path))
+            except Exception:
+                # 행마다 칸 수가 다른 비정형 CSV 등은 stdlib 파서로 폴백
+                pass
+        # 파일 전체를 한 번에 디코딩한 뒤 파싱한다.
+        # (텍스트 파일 객체를 넘기면 csv가 줄 단위로 디코딩을 반복한다)
+        with open(path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text = mm[:].decode("utf-8")
+            except ValueError:
+                text = f.read().decode("utf-8")
+        # keepends=True: 따옴표 안의 개행이 보존되어야 csv가 올바르게 파싱한다
+        return [row for row in csv.reader(text.splitlines(keepends=True))]
+    except (OSError, ValueError, csv.Error) as e:
+        raise FileOperationError("CSV 로드 실패", e, path) from e
+
+
+def save_csv(path: Path, data: List[List[str]]) -> None:
+    try:
+        # 메모리 버퍼에 전부 쓴 뒤(newline=''과 동일 규칙) 한 번에 내보낸다
+        buf = io.StringIO(newline="")
+        csv.writer(buf).writerows(data)
+        _atomic_write_bytes(path, buf.getvalue().encode("utf-8"))
+    except (OSError, ValueError, csv.Error) as e:
+        raise FileOperationError("CSV 저장 실패", e, path) from e
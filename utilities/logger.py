@@ -1,285 +1,372 @@
-# utilities/logger.py
-"""
-중앙 로깅 유틸리티
-------------------
-어떤 프로젝트에서든 재사용 가능한 독립적인 로깅 모듈
-
-특징:
-1. 독립성: 외부 설정(AppEnv, AppConfig 등)에 의존하지 않음
-2. 주입식(Dependency Injection): 초기화 시점에 설정을 주입받음
-3. 기능: 콘솔 컬러 출력, 날짜별 파일 로테이션, 에러 별도 저장
-"""
-
-import logging
-import os
-import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Optional
-
-
-# =============================================================================
-# 콘솔에서 컬러 출력을 위한 포매터
-# =============================================================================
-class ColorFormatter(logging.Formatter):
-    """
-    콘솔 출력용 ANSI 색상 포매터
-    """
-
-    COLORS = {
-        "DEBUG": "\x1b[36m",  # Cyan
-        "INFO": "\x1b[32m",  # Green
-        "WARNING": "\x1b[33m",  # Yellow
-        "ERROR": "\x1b[31m",  # Red
-        "CRITICAL": "\x1b[35m",  # Magenta
-        "RESET": "\x1b[0m",
-    }
-
-    def format(self, record: logging.LogRecord) -> str:
-        log_message = super().format(record)
-        if hasattr(sys.stdout, "isatty") and sys.stdout.isatty():
-            color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-            return f"{color}{log_message}{self.COLORS['RESET']}"
-        return log_message
-
-
-# =============================================================================
-# 커스텀 핸들러: 날짜별 파일 직접 생성 + 자동 로테이션
-# =============================================================================
-class DailyRotatingFileHandler(logging.FileHandler):
-    """
-    매일 날짜별로 새로운 로그 파일을 생성하는 핸들러.
-
-    TimedRotatingFileHandler의 문제점(파일명 뒤에 날짜가 붙음, 재시작 시 app.log로 씀 등)을 해결하기 위해
-    날짜가 포함된 파일명(app_YYYYMMDD.log)을 직접 생성하고 관리한다.
-    """
-
-    def __init__(
-        self,
-        log_dir: Path,
-        prefix: str = "app",
-        encoding: str = "utf-8",
-        backup_count: int = 14,
-    ):
-        self.log_dir = log_dir
-        self.prefix = prefix
-        self.backup_count = backup_count
-        self.current_date = datetime.now().date()
-
-        # 오늘 날짜 파일명 계산
-        filename = self._get_filename(self.current_date)
-
-        # 부모 초기화 (파일 열기)
-        super().__init__(str(filename), encoding=encoding, delay=True)
-
-    def _get_filename(self, date_obj) -> Path:
-        """날짜에 해당하는 파일명 반환"""
-        date_str = date_obj.strftime("%Y%m%d")
-        return self.log_dir / f"{self.prefix}_{date_str}.log"
-
-    def emit(self, record):
-        """로그를 기록할 때마다 날짜가 바뀌었는지 체크"""
-        try:
-            # 현재 날짜 확인
-            today = datetime.now().date()
-
-            # 날짜가 바뀌었다면 로테이션 수행
-            if today != self.current_date:
-                self.current_date = today
-                self.close()  # 기존 파일 닫기
-
-                # 새 파일명으로 교체
-                self.baseFilename = str(self._get_filename(today))
-                self.stream = self._open()  # 새 파일 열기
-
-                # 오래된 로그 삭제
-                self.cleanup_old_logs()
-
-            super().emit(record)
-        except Exception:
-            self.handleError(record)
-
-    def cleanup_old_logs(self):
-        """오래된 로그 파일 삭제"""
-        if self.backup_count <= 0:
-            return
-
-        try:
-            # 로그 디렉토리의 모든 파일을 검색
-            for log_file in self.log_dir.glob(f"{self.prefix}_*.log"):
-                # 파일명에서 날짜 추출 (app_20250129.log -> 20250129)
-                try:
-                    date_part = log_file.stem.replace(f"{self.prefix}_", "")
-                    file_date = datetime.strptime(date_part, "%Y%m%d").date()
-
-                    # 보관 기간이 지난 파일 삭제
-                    # (오늘 - 파일날짜) > 보관기간
-                    if (self.current_date - file_date).days > self.backup_count:
-                        os.remove(log_file)
-                        # print(f"Deleted old log: {log_file}") # 디버깅용
-                except (ValueError, OSError):
-                    continue  # 날짜 형식이 아니거나 삭제 실패 시 무시
-        except Exception:
-            pass  # 청소 중 에러는 메인 로직에 영향 주지 않도록 무시
-
-
-# =============================================================================
-# 로거 설정 및 관리 (싱글톤)
-# =============================================================================
-class Logger:
-    """
-    [범용 로거 클래스]
-
-    사용법:
-        1. 앱 시작 지점(main)에서 초기화:
-            Logger.initialize(
-                app_name="MyApp",
-                log_dir=Path("./logs"),
-                level=logging.DEBUG
-            )
-
-        2. 어디서든 가져다 쓰기:
-            from utilities.logger import get_logger
-            logger = get_logger(__name__)
-    """
-
-    _instance: Optional["Logger"] = None
-    _root_logger: Optional[logging.Logger] = None
-    _initialized = False
-
-    # 기본 상수 (필요하면 initialize 인자로 오버라이딩 가능하게 확장 가능)
-    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-    MESSAGE_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
-    ERROR_FORMAT = (
-        "%(asctime)s | %(levelname)s | %(pathname)s:%(lineno)d\n%(message)s\n"
-    )
-
-    LOG_KEEP_DAYS = 14  # 일반 로그 보관 기간
-    ERROR_LOG_KEEP_DAYS = 30  # 에러 로그 보관 기간
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    @classmethod
-    def initialize(
-        cls,
-        app_name: str,
-        log_dir: Path,
-        level: int = logging.INFO,
-        console: bool = True,
-    ):
-        """
-        로거 초기화 (설정 주입)
-
-        Args:
-            app_name: 로거 이름 (프로젝트명)
-            log_dir: 로그를 저장할 폴더 경로 (이미 생성되어 있거나 생성 가능한 경로)
-            level: 기본 로그 레벨 (logging.DEBUG, logging.INFO ...)
-            console: 콘솔 출력 여부 (배포 시 False 권장)
-        """
-        if cls._initialized:
-            return
-
-        cls._initialized = True
-
-        # 1. 로그 디렉토리 생성
-        try:
-            log_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            print(f"❌ 로그 디렉토리 생성 실패: {log_dir} - {e}")
-            return
-
-        # 2. 루트 로거 설정
-        instance = cls()
-        instance._root_logger = logging.getLogger(app_name)
-        instance._root_logger.setLevel(level)
-        instance._root_logger.propagate = False
-        instance._root_logger.handlers.clear()
-
-        # 3. 파일 핸들러 (커스텀: 날짜별 직접 관리)
-
-        # 일반 로그
-        file_handler = DailyRotatingFileHandler(
-            log_dir=log_dir,
-            prefix="app",
-            encoding="utf-8",
-            backup_count=cls.LOG_KEEP_DAYS,
-        )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(
-            logging.Formatter(cls.MESSAGE_FORMAT, cls.DATE_FORMAT)
-        )
-        instance._root_logger.addHandler(file_handler)
-
-        # 에러 로그 (별도 저장)
-        error_handler = DailyRotatingFileHandler(
-            log_dir=log_dir,
-            prefix="error",
-            encoding="utf-8",
-            backup_count=cls.ERROR_LOG_KEEP_DAYS,
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(logging.Formatter(cls.ERROR_FORMAT, cls.DATE_FORMAT))
-        instance._root_logger.addHandler(error_handler)
-
-        # 5. 콘솔 핸들러
-        if console:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(level)
-            console_handler.setFormatter(
-                ColorFormatter(cls.MESSAGE_FORMAT, cls.DATE_FORMAT)
-            )
-            instance._root_logger.addHandler(console_handler)
-
-        # 6. 외부 라이브러리 노이즈 제거
-        cls._suppress_noisy_loggers()
-
-        instance._root_logger.info(f"Logger initialized for '{app_name}' at {log_dir}")
-        print(f"✅ Logger initialized for '{app_name}' at {log_dir}")
-
-    @staticmethod
-    def _suppress_noisy_loggers():
-        noisy_loggers = ["PyQt6", "urllib3", "PIL", "matplotlib"]
-        for name in noisy_loggers:
-            logging.getLogger(name).setLevel(logging.WARNING)
-
-    def _get_child_logger(self, name: str) -> logging.Logger:
-        if self._root_logger is None:
-            # 아직 초기화 안 됐으면 기본 로거라도 반환 (안전장치)
-            return logging.getLogger(name)
-        return self._root_logger.getChild(name)
-
-
-# =============================================================================
-# 공개 함수
-# =============================================================================
-def get_logger(name: str = __name__) -> logging.Logger:
-    """사용자가 사용하는 로거 획득 함수"""
-    return Logger()._get_child_logger(name)
-
-
-# 호환성을 위한 전역 객체(초기화 전 사용 시 기본 로거 반환됨)
-logger = get_logger(__name__)
-
-if __name__ == "__main__":
-    # 테스트 코드
-    print("--- Logger Utility Test ---")
-    test_dir = Path("./test_logs")
-
-    Logger.initialize(
-        app_name="TestApp", log_dir=test_dir, level=logging.DEBUG, console=True
-    )
-
-    log = get_logger("MyModule")
-    log.debug("디버그")
-    log.info("정보")
-    log.warning("경고")
-    log.error("에러")
-    try:
-        1 / 0
-    except Exception:
-        log.exception("예외 발생 테스트")
-
-    print(f"Check logs in: {test_dir.absolute()}")
+# utilities/logger.py
+"""
+중앙 로깅 유틸리티
+------------------
+어떤 프로젝트에서든 재사용 가능한 독립적인 로깅 모듈
+
+특징:
+1. 독립성: 외부 설정(AppEnv, AppConfig 등)에 의존하지 않음
+2. 주입식(Dependency Injection): 초기화 시점에 설정을 주입받음
+3. 기능: 콘솔 컬러 출력, 날짜별 파일 로테이션, 에러 별도 저장
+"""
+
+# ⚠️ picologging 별칭(import picologging as logging)을 시도했다가 되돌렸다.
+# 'C로 구현된 드롭인'이라는 전제가 이 모듈에서는 성립하지 않는다:
+#   - picologging.Logger에는 getChild가 없어 get_logger()가 죽는다
+#   - %(levelname)-8s 같은 패딩 지정자를 렌더링하지 않아 포맷이 깨진다
+# 호환 API가 갖춰지기 전까지는 표준 logging만 쓴다.
+import logging
+from logging.handlers import QueueHandler, QueueListener
+
+import atexit
+import os
+import queue
+from functools import lru_cache
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+
+# =============================================================================
+# 콘솔에서 컬러 출력을 위한 포매터
+# =============================================================================
+class ColorFormatter(logging.Formatter):
+    """
+    콘솔 출력용 ANSI 색상 포매터
+
+    TTY 여부는 생성 시점에 한 번만 검사해서 캐시한다.
+    (레코드마다 isatty 시스템 콜을 하지 않도록)
+    """
+
+    COLORS = {
+        "DEBUG": "\x1b[36m",  # Cyan
+        "INFO": "\x1b[32m",  # Green
+        "WARNING": "\x1b[33m",  # Yellow
+        "ERROR": "\x1b[31m",  # Red
+        "CRITICAL": "\x1b[35m",  # Magenta
+        "RESET": "\x1b[0m",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._use_color = bool(getattr(sys.stdout, "isatty", lambda: False)())
+        # 레벨 이름 -> 색상 접두사 (RESET은 접두사가 아니므로 제외)
+        self._prefix = {k: v for k, v in self.COLORS.items() if k != "RESET"}
+        self._reset = self.COLORS["RESET"]
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_message = super().format(record)
+        if self._use_color:
+            # dict 조회 한 번 + 문자열 연결 두 번이 전부
+            color = self._prefix.get(record.levelname, "")
+            return f"{color}{log_message}{self._reset}"
+        return log_message
+
+
+# =============================================================================
+# 커스텀 핸들러: 날짜별 파일 직접 생성 + 자동 로테이션
+# =============================================================================
+class DailyRotatingFileHandler(logging.FileHandler):
+    """
+    매일 날짜별로 새로운 로그 파일을 생성하는 핸들러.
+
+    TimedRotatingFileHandler의 문제점(파일명 뒤에 날짜가 붙음, 재시작 시 app.log로 씀 등)을 해결하기 위해
+    날짜가 포함된 파일명(app_YYYYMMDD.log)을 직접 생성하고 관리한다.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        prefix: str = "app",
+        encoding: str = "utf-8",
+        backup_count: int = 14,
+    ):
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.backup_count = backup_count
+        self.current_date = datetime.now().date()
+
+        # 다음 자정의 epoch 초. 레코드마다 datetime 객체를 만드는 대신
+        # time.time()과의 float 비교 한 번으로 '날짜가 바뀌었나'를 검사한다.
+        self._next_rollover = self._midnight_after(self.current_date)
+
+        # 청소가 마지막으로 실행된 날짜 (프로세스당 하루 최대 한 번만 청소)
+        self._last_cleanup_day = None
+
+        # 오늘 날짜 파일명 계산
+        filename = self._get_filename(self.current_date)
+
+        # 부모 초기화 (파일 열기)
+        super().__init__(str(filename), encoding=encoding, delay=True)
+
+    @staticmethod
+    def _midnight_after(date_obj) -> float:
+        """해당 날짜의 '다음 날 자정'을 epoch 초로 반환"""
+        next_day = datetime.combine(date_obj + timedelta(days=1), datetime.min.time())
+        return next_day.timestamp()
+
+    def _get_filename(self, date_obj) -> Path:
+        """날짜에 해당하는 파일명 반환"""
+        date_str = date_obj.strftime("%Y%m%d")
+        return self.log_dir / f"{self.prefix}_{date_str}.log"
+
+    def emit(self, record):
+        """로그를 기록할 때마다 날짜가 바뀌었는지 체크 (float 비교 한 번)"""
+        try:
+            # 날짜가 바뀌었다면 로테이션 수행 (하루 한 번만 참이 되는 분기)
+            if time.time() >= self._next_rollover:
+                today = datetime.now().date()
+                self.current_date = today
+                self._next_rollover = self._midnight_after(today)
+                self.close()  # 기존 파일 닫기
+
+                # 새 파일명으로 교체
+                self.baseFilename = str(self._get_filename(today))
+                self.stream = self._open()  # 새 파일 열기
+
+                # 오래된 로그 삭제는 하루 최대 한 번, 백그라운드 스레드에 맡긴다.
+                # (glob + stat 루프가 emit 경로를 막지 않도록)
+                if self._last_cleanup_day != today:
+                    self._last_cleanup_day = today
+                    threading.Thread(target=self.cleanup_old_logs, daemon=True).start()
+
+            super().emit(record)
+        except Exception:
+            self.handleError(record)
+
+    def cleanup_old_logs(self):
+        """오래된 로그 파일 삭제 (mtime 기준, 파일당 stat 한 번)"""
+        if self.backup_count <= 0:
+            return
+
+        # 파일명을 strptime으로 파싱하는 대신 수정 시각(mtime)으로 자른다.
+        # 마지막으로 기록된 지 보관기간이 지난 파일이 삭제 대상이다.
+        cutoff = time.time() - self.backup_count * 86400
+
+        try:
+            # 로그 디렉토리의 모든 파일을 검색
+            for log_file in self.log_dir.glob(f"{self.prefix}_*.log"):
+                try:
+                    if log_file.stat().st_mtime < cutoff:
+                        os.remove(log_file)
+                        # print(f"Deleted old log: {log_file}") # 디버깅용
+                except OSError:
+                    continue  # 동시 삭제 등으로 stat/삭제 실패 시 무시
+        except Exception:
+            pass  # 청소 중 에러는 메인 로직에 영향 주지 않도록 무시
+
+
+# =============================================================================
+# 로거 설정 및 관리 (싱글톤)
+# =============================================================================
+class Logger:
+    """
+    [범용 로거 클래스]
+
+    사용법:
+        1. 앱 시작 지점(main)에서 초기화:
+            Logger.initialize(
+                app_name="MyApp",
+                log_dir=Path("./logs"),
+                level=logging.DEBUG
+            )
+
+        2. 어디서든 가져다 쓰기:
+            from utilities.logger import get_logger
+            logger = get_logger(__name__)
+    """
+
+    _instance: Optional["Logger"] = None
+    _root_logger: Optional[logging.Logger] = None
+    _initialized = False
+    _queue_listener: Optional[QueueListener] = None
+
+    # initialize에서 설정되는 전역 로그 레벨 스냅샷.
+    # 발신부(BaseView.log 등)가 emit 전에 int 비교 한 번으로
+    # '어차피 버려질 레벨'을 걸러낼 수 있도록 공개한다.
+    current_level: int = logging.INFO
+
+    # 기본 상수 (필요하면 initialize 인자로 오버라이딩 가능하게 확장 가능)
+    DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    MESSAGE_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
+    ERROR_FORMAT = (
+        "%(asctime)s | %(levelname)s | %(pathname)s:%(lineno)d\n%(message)s\n"
+    )
+
+    LOG_KEEP_DAYS = 14  # 일반 로그 보관 기간
+    ERROR_LOG_KEEP_DAYS = 30  # 에러 로그 보관 기간
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    @classmethod
+    def initialize(
+        cls,
+        app_name: str,
+        log_dir: str | Path,
+        level: int = logging.INFO,
+        console: bool = True,
+    ):
+        """
+        로거 초기화 (설정 주입)
+
+        Args:
+            app_name: 로거 이름 (프로젝트명)
+            log_dir: 로그를 저장할 폴더 경로 (이미 생성되어 있거나 생성 가능한 경로)
+            level: 기본 로그 레벨 (logging.DEBUG, logging.INFO ...)
+            console: 콘솔 출력 여부 (배포 시 False 권장)
+        """
+        if cls._initialized:
+            return
+
+        cls._initialized = True
+        cls.current_level = level
+
+        # 호출부가 str 경로를 줘도 동작하도록 여기서 한 번만 Path로 변환
+        log_dir = Path(log_dir)
+
+        # 1. 로그 디렉토리 생성
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"❌ 로그 디렉토리 생성 실패: {log_dir} - {e}")
+            return
+
+        # 2. 루트 로거 설정
+        instance = cls()
+        instance._root_logger = logging.getLogger(app_name)
+        instance._root_logger.setLevel(level)
+        instance._root_logger.propagate = False
+        instance._root_logger.handlers.clear()
+
+        # initialize 이전에 받아가 캐시된 '설정 없는' 로거들을 무효화한다
+        cls.reset_cache()
+
+        # 3. 파일 핸들러 (커스텀: 날짜별 직접 관리)
+
+        # 일반 로그
+        file_handler = DailyRotatingFileHandler(
+            log_dir=log_dir,
+            prefix="app",
+            encoding="utf-8",
+            backup_count=cls.LOG_KEEP_DAYS,
+        )
+        file_handler.setLevel(level)
+        file_handler.setFormatter(
+            logging.Formatter(cls.MESSAGE_FORMAT, cls.DATE_FORMAT)
+        )
+
+        # 에러 로그 (별도 저장)
+        error_handler = DailyRotatingFileHandler(
+            log_dir=log_dir,
+            prefix="error",
+            encoding="utf-8",
+            backup_count=cls.ERROR_LOG_KEEP_DAYS,
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(logging.Formatter(cls.ERROR_FORMAT, cls.DATE_FORMAT))
+
+        sinks = [file_handler, error_handler]
+
+        # 5. 콘솔 핸들러
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(
+                ColorFormatter(cls.MESSAGE_FORMAT, cls.DATE_FORMAT)
+            )
+            sinks.append(console_handler)
+
+        # 5-1. 큐 기반 비동기 기록 (생산자/소비자 패턴)
+        # 로거에는 QueueHandler 하나만 붙인다. 로그를 부르는 쪽(UI/워커 스레드)은
+        # O(1) enqueue만 하고 바로 리턴하고, 실제 포맷팅과 디스크 쓰기는
+        # QueueListener의 전용 스레드가 처리한다. -> 디스크 지연이 호출 스레드
+        # (특히 GUI 스레드)를 절대 멈추지 못한다.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        cls._queue_listener = QueueListener(
+            log_queue, *sinks, respect_handler_level=True
+        )
+        cls._queue_listener.start()
+        instance._root_logger.addHandler(QueueHandler(log_queue))
+
+        # 앱 종료 시 큐에 남은 레코드를 비우고 소비자 스레드를 정리한다
+        atexit.register(cls.shutdown)
+
+        # 6. 외부 라이브러리 노이즈 제거
+        cls._suppress_noisy_loggers()
+
+        instance._root_logger.info(f"Logger initialized for '{app_name}' at {log_dir}")
+        print(f"✅ Logger initialized for '{app_name}' at {log_dir}")
+
+    @classmethod
+    def reset_cache(cls):
+        """
+        get_logger의 이름 캐시를 비운다.
+
+        initialize() 이전에 받아간 로거는 설정 없는 기본 로거이므로,
+        initialize가 다시 불리거나 테스트에서 재설정할 때 호출한다.
+        """
+        get_logger.cache_clear()
+
+    @classmethod
+    def shutdown(cls):
+        """소비자 스레드를 멈추고 큐에 남은 로그를 전부 기록한다. (멱등)"""
+        listener, cls._queue_listener = cls._queue_listener, None
+        if listener is not None:
+            listener.stop()
+
+    @staticmethod
+    def _suppress_noisy_loggers():
+        noisy_loggers = ["PyQt6", "urllib3", "PIL", "matplotlib"]
+        for name in noisy_loggers:
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    def _get_child_logger(self, name: str) -> logging.Logger:
+        if self._root_logger is None:
+            # 아직 초기화 안 됐으면 기본 로거라도 반환 (안전장치)
+            return logging.getLogger(name)
+        return self._root_logger.getChild(name)
+
+
+# =============================================================================
+# 공개 함수
+# =============================================================================
+@lru_cache(maxsize=None)
+def get_logger(name: str = __name__) -> logging.Logger:
+    """
+    사용자가 사용하는 로거 획득 함수
+
+    이름별로 캐시되므로 핫 루프 안에서 불러도 dict 조회 한 번이다.
+    (getChild는 내부적으로 Manager 락을 잡는다)
+    """
+    return Logger()._get_child_logger(name)
+
+
+# 호환성을 위한 전역 객체(초기화 전 사용 시 기본 로거 반환됨)
+logger = get_logger(__name__)
+
+if __name__ == "__main__":
+    # 테스트 코드
+    print("--- Logger Utility Test ---")
+    test_dir = Path("./test_logs")
+
+    Logger.initialize(
+        app_name="TestApp", log_dir=test_dir, level=logging.DEBUG, console=True
+    )
+
+    log = get_logger("MyModule")
+    log.debug("디버그")
+    log.info("정보")
+    log.warning("경고")
+    log.error("에러")
+    try:
+        1 / 0
+    except Exception:
+        log.exception("예외 발생 테스트")
+
+    print(f"Check logs in: {test_dir.absolute()}")
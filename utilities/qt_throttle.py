@@ -0,0 +1,96 @@
+# utilities/qt_throttle.py
+"""
+시그널/함수 호출 스로틀링 유틸리티
+
+타이트한 루프에서 같은 함수(특히 Signal.emit)를 마구 부르면, 호출 1건마다
+Qt 이벤트(QMetaCallEvent) 할당과 GUI 스레드 웨이크업이 발생한다.
+여기 있는 배처(batcher)는 짧은 시간 창 안에 몰린 호출들을 모아뒀다가
+타이머 틱 한 번에 몰아서 전달한다. -> 웨이크업 횟수가 O(호출수)에서
+O(초당 창 개수)로 줄어든다.
+
+⚠️ 순수 스로틀러(마지막 호출만 살리는 방식)와 달리, 호출을 '버리지 않고'
+전부 모았다가 흘려보낸다. 로그처럼 레코드 유실이 곤란한 채널에 안전하다.
+
+⚠️ QTimer를 쓰므로 이벤트 루프가 도는 스레드에서 만들고 호출해야 한다.
+(GUI 스레드의 위젯/뷰모델에는 적합, moveToThread 되는 워커에는 부적합)
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
+
+
+class QSignalBatcher:
+    """
+    호출들을 모아서 배치 창(timeout ms)마다 한꺼번에 전달하는 호출 래퍼
+
+    사용 예:
+        emit_batched = qthrottled(EVENT_BUS.log.message.emit, timeout=50)
+        emit_batched("MyView", "메시지", "INFO")   # 바로 안 나가고 모인다
+        # 50ms 안에 몰린 호출들이 타이머 틱 한 번에 순서대로 전달된다
+    """
+
+    __slots__ = ("_fn", "_batch_fn", "_batch_threshold", "_pending", "_timer")
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        timeout: int = 50,
+        parent: QObject | None = None,
+        batch_fn: Callable[[list], Any] | None = None,
+        batch_threshold: int = 16,
+    ):
+        self._fn = fn
+        # batch_fn이 주어지면, 한 창에 batch_threshold건을 초과해 몰렸을 때
+        # 건별 fn 대신 '리스트 하나를 받는' batch_fn 한 번으로 몰아 보낸다.
+        # (예: EVENT_BUS.log.messages.emit - 시그널 1회에 N건 운반)
+        self._batch_fn = batch_fn
+        self._batch_threshold = batch_threshold
+        self._pending: list[tuple] = []
+
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self.flush)
+
+        # 종료 시 잔여 플러시: 타이머 틱을 기다리던 마지막 배치 창(최대
+        # timeout ms)의 레코드들 - 크래시/종료 직전의 ERROR가 바로 여기
+        # 들어있다 - 이 조용히 사라지지 않도록 한다.
+        if parent is not None:
+            # 부모가 파괴되면 타이머도 같이 사라지므로 그 직전에 비운다
+            parent.destroyed.connect(self.flush)
+        else:
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.flush)
+
+    def __call__(self, *args: Any) -> None:
+        """호출을 큐에 쌓고, 배치 창 타이머가 없으면 시작한다."""
+        self._pending.append(args)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> None:
+        """지금까지 모인 호출들을 순서대로 전부 전달한다."""
+        pending, self._pending = self._pending, []
+
+        # 지속 부하: 배치 시그널 한 번으로 전부 나른다
+        if self._batch_fn is not None and len(pending) > self._batch_threshold:
+            self._batch_fn(pending)
+            return
+
+        # 평상시: 기존(단건) 시그널로 호환성 있게 전달
+        fn = self._fn
+        for args in pending:
+            fn(*args)
+
+
+def qthrottled(
+    fn: Callable[..., Any],
+    timeout: int = 50,
+    parent: QObject | None = None,
+    batch_fn: Callable[[list], Any] | None = None,
+) -> QSignalBatcher:
+    """fn을 배치 창(timeout ms) 단위로 묶어서 호출하는 래퍼를 돌려준다."""
+    return QSignalBatcher(fn, timeout, parent, batch_fn=batch_fn)
@@ -1,34 +1,64 @@
-from PySide6.QtCore import QObject
-
-from core.events.qt_bus import EVENT_BUS
-
-
-class BaseViewModel(QObject):
-    """
-    모든 ViewModel의 기본 클래스이다.
-    QObject를 상속받아 시그널/슬롯 기능을 지원한다.
-    """
-
-    def __init__(self):
-        super().__init__()
-        # 로그 소스 이름 설정 (클래스 이름 자동 사용)
-        self.log_source = self.__class__.__name__
-
-    # ==========================================================
-    # [외부 접근] 로깅
-    # ==========================================================
-    def log(self, message: str, level: str = "INFO"):
-        """EventBus를 통해 로그를 전송한다."""
-        EVENT_BUS.log.message.emit(self.log_source, message, level)
-
-    def log_info(self, message: str):
-        self.log(message, "INFO")
-
-    def log_warning(self, message: str):
-        self.log(message, "WARNING")
-
-    def log_error(self, message: str):
-        self.log(message, "ERROR")
-
-    def log_debug(self, message: str):
-        self.log(message, "DEBUG")
+from PySide6.QtCore import QObject, Slot
+
+from core.events.qt_bus import EVENT_BUS
+from utilities.logger import Logger
+from utilities.qt_throttle import qthrottled
+
+
+# 로그 레벨 문자열 -> 숫자 (emit 전 가드용)
+_LEVEL_MAP = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+class BaseViewModel(QObject):
+    """
+    모든 ViewModel의 기본 클래스이다.
+    QObject를 상속받아 시그널/슬롯 기능을 지원한다.
+    """
+
+    # 로그 소스 이름 (클래스 이름 자동 사용, 클래스당 한 번만 계산)
+    log_source = "BaseViewModel"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.log_source = cls.__name__
+
+    def __init__(self):
+        super().__init__()
+
+        # 로그 폭주(버스트) 대비: emit을 50ms 배치 창으로 묶는다.
+        self._emit_log = qthrottled(
+            EVENT_BUS.log.message.emit,
+            timeout=50,
+            parent=self,
+            # 한 창에 로그가 쏟아지면 단건 시그널 N회 대신 배치 시그널 1회로
+            batch_fn=EVENT_BUS.log.messages.emit,
+        )
+
+        # 레벨별 헬퍼는 emit까지 한 프레임에 가는 클로저로 미리 바인딩한다.
+        # Logger.current_level 가드: 꺼진 레벨이면 int 비교 한 번으로 끝난다.
+        emit = self._emit_log
+        src = self.log_source
+        self.log_info = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "INFO") if Logger.current_level <= 20 else None
+        )
+        self.log_warning = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "WARNING") if Logger.current_level <= 30 else None
+        )
+        self.log_error = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "ERROR") if Logger.current_level <= 40 else None
+        )
+        self.log_debug = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "DEBUG") if Logger.current_level <= 10 else None
+        )
+
+    # ==========================================================
+    # [외부 접근] 로깅
+    # ==========================================================
+    # @Slot 덕분에 connect 시 동적 슬롯 등록 비용이 없다 (정적 메타슬롯 사용)
+    @Slot(str, str)
+    def log(self, message: str, level: str = "INFO"):
+        """EventBus를 통해 로그를 전송한다. (배치 창 단위로 묶어서)"""
+        if _LEVEL_MAP.get(level, 20) < Logger.current_level:
+            return  # 어차피 버려질 레벨 -> emit 비용 자체를 건너뛴다
+        self._emit_log(self.log_source, message, level)
+
@@ -1,65 +1,95 @@
-from PySide6.QtCore import QObject, Signal, QThread
-
-from core.events.qt_bus import EVENT_BUS
-
-
-class BaseWorker(QObject):
-    """
-    백그라운드 작업을 수행하는 Worker의 기본 클래스이다.
-    스레드 제어는 완전히 Service에 위임하고, 오직 비즈니스 로직에만 집중한다.
-    작업 상태(성공, 실패)를 시그널로 알린다.
-    """
-
-    worker_started = Signal()          # 작업 시작 시
-    worker_finished = Signal()         # 정상 완료 시
-    worker_failed = Signal(str)        # 에러 발생 시
-
-    def __init__(self):
-        super().__init__()
-        self.log_source = self.__class__.__name__
-
-    # ==========================================================
-    # [외부 접근] 로깅
-    # ==========================================================
-    def log(self, message: str, level: str = "INFO"):
-        """EventBus를 통해 로그를 전송한다."""
-        EVENT_BUS.log.message.emit(self.log_source, message, level)
-
-    def log_info(self, message: str): self.log(message, "INFO")
-    def log_warning(self, message: str): self.log(message, "WARNING")
-    def log_error(self, message: str): self.log(message, "ERROR")
-    def log_debug(self, message: str): self.log(message, "DEBUG")
-
-    # ==========================================================
-    # Entry Point
-    # ==========================================================
-    def run(self):
-        """Service의 스레드 시작 시 연결되는 메인 진입점이다."""
-
-        self.log_info("작업 시작")
-        self.worker_started.emit()
-
-        try:
-            self.process()
-        except Exception as e:
-            self.log_error(f"작업 중 예외 발생: {str(e)}")
-            self.worker_failed.emit(str(e))
-            return  # 예외 발생 시 즉시 종료 (finished 시그널 발생 안 함)
-
-        # 에러 없이 루프를 빠져나왔을 때만 완료 시그널 전송
-        self.worker_finished.emit()
-
-    def stop_custom_resources(self):
-        """
-        [선택적 오버라이드] 
-        스레드 Interruption 외에 DB 커넥션 종료, 소켓 닫기 등
-        Worker 내부에서 점유한 자원을 비동기적으로 해제해야 할 때 하위 클래스에서 오버라이드한다.
-        """
-        pass
-
-    # ==========================================================
-    # [하위 클래스 구현부]
-    # ==========================================================
-    def process(self):
-        """작업 로직을 구현한다."""
-        raise NotImplementedError("하위 클래스에서 구현해야 한다.")
+from PySide6.QtCore import QObject, Signal, Slot, QThread
+
+from core.events.qt_bus import EVENT_BUS
+from utilities.logger import Logger
+
+
+# 로그 레벨 문자열 -> 숫자 (emit 전 가드용)
+_LEVEL_MAP = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+class BaseWorker(QObject):
+    """
+    백그라운드 작업을 수행하는 Worker의 기본 클래스이다.
+    스레드 제어는 완전히 Service에 위임하고, 오직 비즈니스 로직에만 집중한다.
+    작업 상태(성공, 실패)를 시그널로 알린다.
+    """
+
+    worker_started = Signal()          # 작업 시작 시
+    worker_finished = Signal()         # 정상 완료 시
+    worker_failed = Signal(str)        # 에러 발생 시
+
+    # 로그 소스 이름 (클래스 이름 자동 사용, 클래스당 한 번만 계산)
+    log_source = "BaseWorker"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.log_source = cls.__name__
+
+    def __init__(self):
+        super().__init__()
+
+        # 레벨별 헬퍼는 emit까지 한 프레임에 가는 클로저로 미리 바인딩한다.
+        # (워커는 스레드 친화성 문제로 배처 없이 버스 emit에 직결)
+        # Logger.current_level 가드: 꺼진 레벨이면 int 비교 한 번으로 끝난다.
+        emit = EVENT_BUS.log.message.emit
+        src = self.log_source
+        self.log_info = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "INFO") if Logger.current_level <= 20 else None
+        )
+        self.log_warning = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "WARNING") if Logger.current_level <= 30 else None
+        )
+        self.log_error = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "ERROR") if Logger.current_level <= 40 else None
+        )
+        self.log_debug = lambda m, _e=emit, _s=src: (
+            _e(_s, m, "DEBUG") if Logger.current_level <= 10 else None
+        )
+
+    # ==========================================================
+    # [외부 접근] 로깅
+    # ==========================================================
+    # @Slot 덕분에 connect 시 동적 슬롯 등록 비용이 없다 (정적 메타슬롯 사용)
+    @Slot(str, str)
+    def log(self, message: str, level: str = "INFO"):
+        """EventBus를 통해 로그를 전송한다."""
+        if _LEVEL_MAP.get(level, 20) < Logger.current_level:
+            return  # 어차피 버려질 레벨 -> emit 비용 자체를 건너뛴다
+        EVENT_BUS.log.message.emit(self.log_source, message, level)
+
+
+    # ==========================================================
+    # Entry Point
+    # ==========================================================
+    @Slot()
+    def run(self):
+        """Service의 스레드 시작 시 연결되는 메인 진입점이다."""
+
+        self.log_info("작업 시작")
+        self.worker_started.emit()
+
+        try:
+            self.process()
+        except Exception as e:
+            self.log_error(f"작업 중 예외 발생: {str(e)}")
+            self.worker_failed.emit(str(e))
+            return  # 예외 발생 시 즉시 종료 (finished 시그널 발생 안 함)
+
+        # 에러 없이 루프를 빠져나왔을 때만 완료 시그널 전송
+        self.worker_finished.emit()
+
+    def stop_custom_resources(self):
+        """
+        [선택적 오버라이드] 
+        스레드 Interruption 외에 DB 커넥션 종료, 소켓 닫기 등
+        Worker 내부에서 점유한 자원을 비동기적으로 해제해야 할 때 하위 클래스에서 오버라이드한다.
+        """
+        pass
+
+    # ==========================================================
+    # [하위 클래스 구현부]
+    # ==========================================================
+    def process(self):
+        """작업 로직을 구현한다."""
+        raise NotImplementedError("하위 클래스에서 구현해야 한다.")